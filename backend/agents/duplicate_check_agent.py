@@ -29,18 +29,30 @@ Detection Strategies:
 """
 
 # Standard library imports
+import functools
+import logging
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 # Local imports
 from config.logging_config import get_logger
-from services.ticket_creation_service import ServiceNowTicketService
+from services.ticket_creation_service import get_servicenow_service
 
 # Initialize logger
 logger = get_logger("duplicate_check_agent")
 
 
+@functools.lru_cache(maxsize=4096)
+def _text_ratio(text1_lower: str, text2_lower: str) -> float:
+    """SequenceMatcher ratio of two normalized texts, memoized per pair"""
+    return SequenceMatcher(None, text1_lower, text2_lower).ratio()
+
+
+# Allowance for float rounding when comparing against a description floor
+_FLOOR_SLACK = 1e-9
+
+
 class DuplicateCheckAgent:
     """
     Intelligent duplicate detection and prevention agent.
@@ -70,6 +82,14 @@ class DuplicateCheckAgent:
         - Provides detailed analysis for borderline cases
     """
     
+    # Weights of the similarity factors (they sum to 1.0), shared by the
+    # score and by the description floor used to skip hopeless candidates
+    _DESCRIPTION_WEIGHT = 0.4
+    _CATEGORY_WEIGHT = 0.2
+    _PRIORITY_WEIGHT = 0.15
+    _USER_WEIGHT = 0.15
+    _TIME_WEIGHT = 0.1
+    
     def __init__(self):
         """
         Initialize the duplicate check agent with default configuration.
@@ -77,13 +97,13 @@ class DuplicateCheckAgent:
         Sets up ServiceNow integration and configures detection parameters
         based on business requirements and performance considerations.
         """
-        self.servicenow_service = ServiceNowTicketService()
+        self.servicenow_service = get_servicenow_service()
         self.similarity_threshold = 0.7  # 70% similarity threshold
         self.time_window_days = 30  # Search within last 30 days
         
         logger.info("Duplicate Check Agent initialized successfully")
-        logger.info(f"Similarity threshold: {self.similarity_threshold}")
-        logger.info(f"Time window: {self.time_window_days} days")
+        logger.info("Similarity threshold: %s", self.similarity_threshold)
+        logger.info("Time window: %s days", self.time_window_days)
     
     def check_duplicates(self, ticket_data: Dict[str, Any], 
                         user_id: str, ticket_type: str) -> Dict[str, Any]:
@@ -110,9 +130,8 @@ class DuplicateCheckAgent:
         Raises:
             Exception: If ServiceNow API call fails or data processing errors
         """
-        logger.info(f"Starting duplicate check for {ticket_type} ticket "
-                   f"by user: {user_id}")
-        logger.debug(f"Analyzing ticket data: {ticket_data}")
+        logger.info("Starting duplicate check for %s ticket by user: %s", ticket_type, user_id)
+        logger.debug("Analyzing ticket data: %s", ticket_data)
         
         try:
             # Build comprehensive search criteria
@@ -126,7 +145,7 @@ class DuplicateCheckAgent:
             
             # Search for existing tickets
             existing_tickets = self.servicenow_service.search_duplicates(search_criteria)
-            logger.info(f"Found {len(existing_tickets)} existing tickets to analyze")
+            logger.info("Found %s existing tickets to analyze", len(existing_tickets))
             
             if not existing_tickets:
                 logger.info("No existing tickets found - no duplicates detected")
@@ -136,40 +155,44 @@ class DuplicateCheckAgent:
                     "message": "No similar tickets found. Proceeding with ticket creation."
                 }
             
-            # Calculate similarity scores
+            # Calculate similarity scores, skipping the text comparison for
+            # tickets that cannot reach the threshold whatever it returns
+            desc_similarities = self._description_similarities(
+                ticket_data.get("short_description", ""),
+                [ticket.get("short_description", "") for ticket in existing_tickets],
+                [self._description_floor(ticket_data, ticket) for ticket in existing_tickets]
+            )
             duplicates = []
-            for ticket in existing_tickets:
-                similarity_score = self.calculate_similarity_score(ticket_data, ticket)
-                logger.debug(f"Similarity score for ticket {ticket.get('number', 'N/A')}: {similarity_score:.2f}")
+            for ticket, desc_similarity in zip(existing_tickets, desc_similarities):
+                if desc_similarity is None:
+                    continue
+                similarity_score = self.calculate_similarity_score(ticket_data, ticket, desc_similarity)
+                logger.debug("Similarity score for ticket %s: %.2f", ticket.get('number', 'N/A'), similarity_score)
                 
                 if similarity_score >= self.similarity_threshold:
-                    duplicates.append({
-                        "ticket": ticket,
-                        "similarity_score": similarity_score,
-                        "similarity_reasons": self._get_similarity_reasons(ticket_data, ticket, similarity_score)
-                    })
+                    duplicates.append((similarity_score, ticket, desc_similarity))
             
             # Sort by similarity score (highest first)
-            duplicates.sort(key=lambda x: x["similarity_score"], reverse=True)
+            duplicates.sort(key=lambda x: x[0], reverse=True)
             
-            logger.info(f"Found {len(duplicates)} potential duplicates above threshold")
+            logger.info("Found %s potential duplicates above threshold", len(duplicates))
             
             if duplicates:
                 # Check if any duplicates are in active states (New, In Progress)
                 active_duplicates = []
                 for dup in duplicates:
-                    ticket = dup["ticket"]
+                    ticket = dup[1]
                     state = ticket.get("state", "")
                     # ServiceNow states: 1=New, 2=In Progress, 6=Resolved, 7=Closed
                     if state in ["1", "2", "New", "In Progress", "Open"]:
                         active_duplicates.append(dup)
                 
                 if active_duplicates:
-                    logger.warning(f"Found {len(active_duplicates)} ACTIVE duplicate tickets - BLOCKING creation")
+                    logger.warning("Found %s ACTIVE duplicate tickets - BLOCKING creation", len(active_duplicates))
                     return {
                         "has_duplicates": True,
                         "should_block_creation": True,  # CRITICAL: Signal to stop creation
-                        "duplicates": active_duplicates[:3],  # Return top 3 active matches
+                        "duplicates": self._attach_bodies(self._duplicate_entries(ticket_data, active_duplicates[:3]), ticket_type),  # Return top 3 active matches
                         "active_count": len(active_duplicates),
                         "message": f"DUPLICATE PREVENTION: Found {len(active_duplicates)} active tickets with similar issues. Please review existing tickets before creating a new one.",
                         "recommendation": "Review and update existing active ticket instead of creating duplicate",
@@ -180,7 +203,7 @@ class DuplicateCheckAgent:
                     return {
                         "has_duplicates": True,
                         "should_block_creation": False,  # Allow creation - no active duplicates
-                        "duplicates": duplicates[:5],  # Return top 5 matches for reference
+                        "duplicates": self._attach_bodies(self._duplicate_entries(ticket_data, duplicates[:5]), ticket_type),  # Return top 5 matches for reference
                         "message": f"Found {len(duplicates)} similar resolved tickets. Proceeding with new ticket creation.",
                         "recommendation": "Proceed with creation - previous similar issues were resolved"
                     }
@@ -193,7 +216,7 @@ class DuplicateCheckAgent:
                 }
                 
         except Exception as e:
-            logger.error(f"Error checking duplicates: {str(e)}")
+            logger.error("Error checking duplicates: %s", e)
             return {
                 "has_duplicates": False,
                 "duplicates": [],
@@ -201,13 +224,38 @@ class DuplicateCheckAgent:
                 "error": str(e)
             }
     
-    def calculate_similarity_score(self, new_ticket: Dict[str, Any], existing_ticket: Dict[str, Any]) -> float:
+    def _duplicate_entries(self, new_ticket: Dict[str, Any],
+                           scored: List[Tuple[float, Dict[str, Any], float]]) -> List[Dict[str, Any]]:
+        """Turn kept (score, ticket, desc_similarity) matches into reported duplicates with reasons"""
+        return [
+            {
+                "ticket": ticket,
+                "similarity_score": similarity_score,
+                "similarity_reasons": self._get_similarity_reasons(new_ticket, ticket, similarity_score, desc_similarity)
+            }
+            for similarity_score, ticket, desc_similarity in scored
+        ]
+    
+    def _attach_bodies(self, duplicates: List[Dict[str, Any]], ticket_type: str) -> List[Dict[str, Any]]:
+        """Complete the returned duplicates with their full records in one query"""
+        bodies = self.servicenow_service.fetch_duplicate_bodies(
+            [dup["ticket"].get("sys_id", "") for dup in duplicates], ticket_type
+        )
+        for dup in duplicates:
+            body = bodies.get(dup["ticket"].get("sys_id", ""))
+            if body:
+                dup["ticket"] = {**dup["ticket"], **body}
+        return duplicates
+    
+    def calculate_similarity_score(self, new_ticket: Dict[str, Any], existing_ticket: Dict[str, Any],
+                                   desc_similarity: Optional[float] = None) -> float:
         """
         Calculate similarity score between new and existing ticket
         
         Args:
             new_ticket: New ticket data
             existing_ticket: Existing ticket data
+            desc_similarity: Precomputed description similarity, if known
             
         Returns:
             Similarity score between 0.0 and 1.0
@@ -217,41 +265,61 @@ class DuplicateCheckAgent:
         try:
             scores = []
             
-            # 1. Description similarity (40% weight)
-            desc_similarity = self._calculate_text_similarity(
-                new_ticket.get("short_description", ""),
-                existing_ticket.get("short_description", "")
-            )
-            scores.append(("description", desc_similarity, 0.4))
+            # 1. Description similarity
+            if desc_similarity is None:
+                desc_similarity = self._calculate_text_similarity(
+                    new_ticket.get("short_description", ""),
+                    existing_ticket.get("short_description", "")
+                )
+            scores.append(("description", desc_similarity, self._DESCRIPTION_WEIGHT))
             
-            # 2. Category match (20% weight)
+            # 2. Category match
             category_match = 1.0 if new_ticket.get("category") == existing_ticket.get("category") else 0.0
-            scores.append(("category", category_match, 0.2))
+            scores.append(("category", category_match, self._CATEGORY_WEIGHT))
             
-            # 3. Priority match (15% weight)
+            # 3. Priority match
             priority_match = 1.0 if new_ticket.get("priority") == existing_ticket.get("priority") else 0.0
-            scores.append(("priority", priority_match, 0.15))
+            scores.append(("priority", priority_match, self._PRIORITY_WEIGHT))
             
-            # 4. User match (15% weight)
+            # 4. User match
             user_match = 1.0 if new_ticket.get("caller_id") == existing_ticket.get("caller_id") else 0.0
-            scores.append(("user", user_match, 0.15))
+            scores.append(("user", user_match, self._USER_WEIGHT))
             
-            # 5. Time proximity (10% weight)
+            # 5. Time proximity
             time_score = self._calculate_time_proximity(existing_ticket.get("created", ""))
-            scores.append(("time", time_score, 0.1))
+            scores.append(("time", time_score, self._TIME_WEIGHT))
             
             # Calculate weighted average
             total_score = sum(score * weight for _, score, weight in scores)
             
-            logger.debug(f"Similarity breakdown: {[(name, f'{score:.2f}', f'{weight:.2f}') for name, score, weight in scores]}")
-            logger.debug(f"Total similarity score: {total_score:.2f}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Similarity breakdown: %s", [(name, f'{score:.2f}', f'{weight:.2f}') for name, score, weight in scores])
+                logger.debug("Total similarity score: %.2f", total_score)
             
             return total_score
             
         except Exception as e:
-            logger.error(f"Error calculating similarity score: {str(e)}")
+            logger.error("Error calculating similarity score: %s", e)
             return 0.0
     
+    def score_batch(self, new_ticket: Dict[str, Any], candidates: List[Dict[str, Any]]) -> List[float]:
+        """
+        Calculate similarity scores between a new ticket and many candidates
+        
+        Args:
+            new_ticket: New ticket data
+            candidates: Existing tickets to compare against
+            
+        Returns:
+            Similarity scores in candidate order, same as ``calculate_similarity_score``
+        """
+        desc_similarities = self._description_similarities(
+            new_ticket.get("short_description", ""),
+            [ticket.get("short_description", "") for ticket in candidates]
+        )
+        return [self.calculate_similarity_score(new_ticket, ticket, desc_similarity)
+                for ticket, desc_similarity in zip(candidates, desc_similarities)]
+    
     def _calculate_text_similarity(self, text1: str, text2: str) -> float:
         """Calculate text similarity using SequenceMatcher"""
         if not text1 or not text2:
@@ -264,9 +332,61 @@ class DuplicateCheckAgent:
         if text1_lower == text2_lower:
             return 1.0
         
-        # Use SequenceMatcher for fuzzy matching
-        similarity = SequenceMatcher(None, text1_lower, text2_lower).ratio()
-        return similarity
+        # Use SequenceMatcher for fuzzy matching (the same pair is scored
+        # again for the similarity reasons, so results are memoized)
+        return _text_ratio(text1_lower, text2_lower)
+    
+    def _description_similarities(self, new_text: str, candidates: List[str],
+                                  floors: Optional[List[float]] = None) -> List[Optional[float]]:
+        """
+        Calculate the new description's similarity to each candidate.
+        
+        Same scores as ``_calculate_text_similarity``; the new text is
+        normalized once. SequenceMatcher only indexes its second sequence,
+        and the new text has to stay first (ratio() is not symmetric), so
+        each candidate is still indexed on its own.
+        
+        When ``floors`` is given, a candidate whose similarity provably falls
+        below its floor (by the matcher's cheap upper bounds) gets None
+        instead of a score.
+        """
+        if floors is None:
+            floors = [float("-inf")] * len(candidates)
+        if not new_text:
+            return [0.0 if floor <= _FLOOR_SLACK else None for floor in floors]
+        
+        new_lower = new_text.lower().strip()
+        matcher = SequenceMatcher(None)
+        matcher.set_seq1(new_lower)
+        similarities = []
+        for text, floor in zip(candidates, floors):
+            floor -= _FLOOR_SLACK
+            if floor > 1.0:
+                similarities.append(None)
+                continue
+            if not text:
+                similarities.append(0.0 if floor <= 0.0 else None)
+                continue
+            text_lower = text.lower().strip()
+            if text_lower == new_lower:
+                similarities.append(1.0)
+                continue
+            matcher.set_seq2(text_lower)
+            if floor > 0.0 and (matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor):
+                similarities.append(None)
+                continue
+            similarities.append(matcher.ratio())
+        return similarities
+    
+    def _description_floor(self, new_ticket: Dict[str, Any], existing_ticket: Dict[str, Any]) -> float:
+        """Lowest description similarity that could still reach the threshold"""
+        other_score = (
+            self._CATEGORY_WEIGHT * (new_ticket.get("category") == existing_ticket.get("category"))
+            + self._PRIORITY_WEIGHT * (new_ticket.get("priority") == existing_ticket.get("priority"))
+            + self._USER_WEIGHT * (new_ticket.get("caller_id") == existing_ticket.get("caller_id"))
+            + self._TIME_WEIGHT * self._calculate_time_proximity(existing_ticket.get("created", ""))
+        )
+        return (self.similarity_threshold - other_score) / self._DESCRIPTION_WEIGHT
     
     def _calculate_time_proximity(self, created_date: str) -> float:
         """Calculate time proximity score (newer tickets get higher scores)"""
@@ -289,18 +409,20 @@ class DuplicateCheckAgent:
                 return 0.2
                 
         except Exception as e:
-            logger.warning(f"Error parsing date {created_date}: {str(e)}")
+            logger.warning("Error parsing date %s: %s", created_date, e)
             return 0.0
     
-    def _get_similarity_reasons(self, new_ticket: Dict[str, Any], existing_ticket: Dict[str, Any], score: float) -> List[str]:
+    def _get_similarity_reasons(self, new_ticket: Dict[str, Any], existing_ticket: Dict[str, Any], score: float,
+                                desc_similarity: Optional[float] = None) -> List[str]:
         """Get reasons why tickets are considered similar"""
         reasons = []
         
         # Check description similarity
-        desc_similarity = self._calculate_text_similarity(
-            new_ticket.get("short_description", ""),
-            existing_ticket.get("short_description", "")
-        )
+        if desc_similarity is None:
+            desc_similarity = self._calculate_text_similarity(
+                new_ticket.get("short_description", ""),
+                existing_ticket.get("short_description", "")
+            )
         if desc_similarity > 0.8:
             reasons.append("Very similar description")
         elif desc_similarity > 0.6:
@@ -358,7 +480,7 @@ class DuplicateCheckAgent:
         Returns:
             Formatted string presenting duplicates to user
         """
-        logger.info(f"Presenting {len(duplicates)} duplicate candidates to user")
+        logger.info("Presenting %s duplicate candidates to user", len(duplicates))
         
         if not duplicates:
             return "No similar tickets found. Proceeding with ticket creation."
@@ -399,7 +521,7 @@ class DuplicateCheckAgent:
         Returns:
             Dictionary with decision result
         """
-        logger.info(f"Handling duplicate decision: {decision}")
+        logger.info("Handling duplicate decision: %s", decision)
         
         if decision.lower() in ["proceed", "continue", "yes", "create"]:
             logger.info("User decided to proceed with ticket creation")
@@ -441,7 +563,7 @@ class DuplicateCheckAgent:
             }
         
         else:
-            logger.warning(f"Unknown decision: {decision}")
+            logger.warning("Unknown decision: %s", decision)
             return {
                 "action": "unknown",
                 "message": "I didn't understand your choice. Please choose: proceed, stop, link, or modify."
@@ -1,6 +1,7 @@
 """
 OCI ADK Compliant Core Search Agent - Updated to follow OCI guidelines
 """
+import asyncio
 from typing import Dict, Any, Optional
 from oci.addons.adk import Agent, AgentClient, tool
 from config.config import Config
@@ -157,31 +158,48 @@ class OciCompliantCoreSearchAgent:
             str: Agent's response using OCI ADK
         """
         try:
-            # Construct agent prompt based on search type
-            if search_type == "auto":
-                prompt = f"Analyze this query and provide the most appropriate search results: {query}"
-            elif search_type == "knowledge":
-                prompt = f"Search the knowledge base for: {query}"
-            elif search_type == "servicenow":
-                prompt = f"Search ServiceNow tickets for: {query}"
-            elif search_type == "mixed":
-                prompt = f"Perform a comprehensive search across all sources for: {query}"
-            else:
-                prompt = f"Search for: {query}"
-            
-            # Add filters to prompt if provided
-            if filters:
-                filter_info = ", ".join([f"{k}: {v}" for k, v in filters.items()])
-                prompt += f" (Filters: {filter_info})"
-            
-            # Use OCI Agent's chat method for intelligent response
-            response = self.agent.chat(message=prompt)
-            
-            return response
+            return self._chat(query, search_type, filters)
         
         except Exception as e:
             return f"Search failed: {str(e)}. Please try again or contact support."
     
+    async def async_search(self, query: str, search_type: str = "auto", 
+                           filters: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Non-blocking variant of search() for use from async callers.
+        
+        The OCI ADK chat call is synchronous, so it is dispatched to a worker
+        thread to let the event loop overlap it with other requests. Unlike
+        search(), failures are raised rather than returned as text, so callers
+        can tell them apart from results (e.g. to avoid caching them).
+        
+        Raises:
+            Exception: If the OCI agent call fails
+        """
+        return await asyncio.to_thread(self._chat, query, search_type, filters)
+    
+    def _chat(self, query: str, search_type: str, filters: Optional[Dict[str, Any]]) -> str:
+        """Send the search prompt to the OCI agent, raising on failure"""
+        # Construct agent prompt based on search type
+        if search_type == "auto":
+            prompt = f"Analyze this query and provide the most appropriate search results: {query}"
+        elif search_type == "knowledge":
+            prompt = f"Search the knowledge base for: {query}"
+        elif search_type == "servicenow":
+            prompt = f"Search ServiceNow tickets for: {query}"
+        elif search_type == "mixed":
+            prompt = f"Perform a comprehensive search across all sources for: {query}"
+        else:
+            prompt = f"Search for: {query}"
+        
+        # Add filters to prompt if provided
+        if filters:
+            filter_info = ", ".join([f"{k}: {v}" for k, v in filters.items()])
+            prompt += f" (Filters: {filter_info})"
+        
+        # Use OCI Agent's chat method for intelligent response
+        return self.agent.chat(message=prompt)
+    
     def _merge_search_results(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """Merge and correlate results from multiple search sources."""
         merged = {
@@ -1,6 +1,8 @@
 """
 Search Agent implementation using OCI ADK
 """
+import asyncio
+
 from oci.addons.adk import Agent, AgentClient
 from config.config import Config
 from tools.search_tools import (
@@ -85,6 +87,22 @@ class SearchAgent:
             result = search_knowledge_base(query)
             return self._format_search_result(result, f"Knowledge base search for: {query}")
     
+    async def async_search(self, query: str, search_type: str = "knowledge") -> str:
+        """
+        Perform a search without blocking the event loop
+        
+        The underlying tool calls are synchronous HTTP requests, so the
+        search runs in a worker thread and can overlap other awaited I/O.
+        
+        Args:
+            query (str): The search query
+            search_type (str): Type of search ("knowledge" or "servicenow")
+        
+        Returns:
+            str: The agent's response
+        """
+        return await asyncio.to_thread(self.search, query, search_type)
+    
     def _format_search_result(self, result: dict, search_type: str) -> str:
         """Format search results into a readable response"""
         if not result:
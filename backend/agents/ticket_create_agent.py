@@ -4,7 +4,7 @@ Ticket Create Agent - Creates tickets in ServiceNow with validation and error ha
 from typing import Dict, Any, Optional
 from datetime import datetime
 from config.logging_config import get_logger
-from services.ticket_creation_service import ServiceNowTicketService
+from services.ticket_creation_service import get_servicenow_service
 
 logger = get_logger("ticket_create_agent")
 
@@ -21,7 +21,7 @@ class TicketCreateAgent:
     """
     
     def __init__(self):
-        self.servicenow_service = ServiceNowTicketService()
+        self.servicenow_service = get_servicenow_service()
         
         # Field mappings for different ticket types
         self.field_mappings = {
@@ -216,16 +216,7 @@ class TicketCreateAgent:
         logger.debug(f"Creating {ticket_type} ticket in ServiceNow")
         
         try:
-            if ticket_type == "incident":
-                return self.servicenow_service.create_incident(formatted_data)
-            elif ticket_type == "request":
-                return self.servicenow_service.create_service_request(formatted_data)
-            elif ticket_type == "change":
-                return self.servicenow_service.create_change_request(formatted_data)
-            elif ticket_type == "problem":
-                return self.servicenow_service.create_problem(formatted_data)
-            else:
-                raise ValueError(f"Unsupported ticket type: {ticket_type}")
+            return self.servicenow_service.create_ticket(ticket_type, formatted_data)
                 
         except Exception as e:
             logger.error(f"Error creating {ticket_type} ticket: {str(e)}")
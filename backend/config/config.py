@@ -79,9 +79,19 @@ class Config:
     OCI_COMPARTMENT_ID = os.getenv("OCI_COMPARTMENT_ID", "")
     OCI_MODEL_ID = os.getenv("OCI_MODEL_ID", "cohere.command")
     
+    # Keep-alive connections held open by the OCI Generative AI client
+    OCI_HTTP_POOL_SIZE = int(os.getenv("OCI_HTTP_POOL_SIZE", "50"))
+    
     # OCI Generative AI Agent Endpoints
     SEARCH_AGENT_ENDPOINT_ID = os.getenv("SEARCH_AGENT_ENDPOINT_ID", "")
     
+    # Maximum OCI searches in flight at once across all chat sessions
+    OCI_SEARCH_MAX_CONCURRENCY = int(os.getenv("OCI_SEARCH_MAX_CONCURRENCY", "32"))
+    
+    # Cache of formatted OCI search results, keyed by query and intent
+    SEARCH_CACHE_MAX_SIZE = int(os.getenv("SEARCH_CACHE_MAX_SIZE", "2048"))
+    SEARCH_CACHE_TTL_SECONDS = int(os.getenv("SEARCH_CACHE_TTL_SECONDS", "300"))
+    
     # ========================= GOOGLE CONFIGURATION =========================
     # Google ADK and Gemini model settings for ticket creation
     
@@ -105,6 +115,24 @@ class Config:
     AZURE_OPENAI_DEPLOYMENT_NAME = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", 
                                            "gpt-4")
     
+    # Pooled HTTP/2 connections shared by all async Azure OpenAI calls
+    AZURE_OPENAI_MAX_CONNECTIONS = int(os.getenv("AZURE_OPENAI_MAX_CONNECTIONS", "64"))
+    AZURE_OPENAI_MAX_KEEPALIVE = int(os.getenv("AZURE_OPENAI_MAX_KEEPALIVE", "32"))
+    
+    # Intent detection micro-batching across concurrent sessions
+    INTENT_BATCH_MAX_SIZE = int(os.getenv("INTENT_BATCH_MAX_SIZE", "16"))
+    INTENT_BATCH_WAIT_MS = int(os.getenv("INTENT_BATCH_WAIT_MS", "20"))
+    
+    # How long a caller waits for its batched OCI classification before
+    # using the keyword result instead
+    INTENT_DETECTION_TIMEOUT_SECONDS = float(os.getenv("INTENT_DETECTION_TIMEOUT_SECONDS", "30"))
+    
+    # Opt-in: how long async OCI intent detection waits before using the
+    # keyword result instead. The budget includes the batching window above
+    # and a streamed classification, so keep it well above both; 0 (the
+    # default) always waits for OCI
+    INTENT_SPECULATIVE_BUDGET_MS = int(os.getenv("INTENT_SPECULATIVE_BUDGET_MS", "0"))
+    
     # ========================= SERVICENOW CONFIGURATION =========================
     # ServiceNow instance and API settings
     
@@ -112,16 +140,33 @@ class Config:
         "SERVICENOW_INSTANCE_URL",
         "https://dev218893.service-now.com"
     )
+    SERVICENOW_USERNAME = os.getenv("SERVICENOW_USERNAME", "")
     SERVICENOW_PASSWORD = os.getenv("SERVICENOW_PASSWORD", "")
     SERVICENOW_DEFAULT_CALLER_ID = os.getenv("SERVICENOW_DEFAULT_CALLER_ID",
                                              "admin")
     SERVICENOW_API_VERSION = os.getenv("SERVICENOW_API_VERSION", "v2")
     SERVICENOW_TIMEOUT = os.getenv("SERVICENOW_TIMEOUT", "30")
     
+    # Pooled keep-alive connections to the ServiceNow instance
+    SERVICENOW_POOL_MAXSIZE = int(os.getenv("SERVICENOW_POOL_MAXSIZE", "20"))
+    
+    # How long ticket records read from ServiceNow are reused
+    SERVICENOW_TICKET_CACHE_TTL_SECONDS = int(os.getenv("SERVICENOW_TICKET_CACHE_TTL_SECONDS", "30"))
+    SERVICENOW_DUPLICATE_CACHE_TTL_SECONDS = int(os.getenv("SERVICENOW_DUPLICATE_CACHE_TTL_SECONDS", "60"))
+    
+    # Ticket reads refresh a cached ticket in the background once it is this
+    # close to expiring, so hot tickets are not re-fetched on the request path
+    SERVICENOW_TICKET_REFRESH_AHEAD_SECONDS = int(os.getenv("SERVICENOW_TICKET_REFRESH_AHEAD_SECONDS", "10"))
+    
     # API Configuration
     API_HOST = os.getenv("API_HOST", "0.0.0.0")
     API_PORT = int(os.getenv("API_PORT", "8000"))
     
+    # Auto-reload is for development; with it off, API_WORKERS processes
+    # serve requests in parallel (more than one requires SESSION_STORE=redis)
+    API_RELOAD = os.getenv("API_RELOAD", "true").lower() == "true"
+    API_WORKERS = int(os.getenv("API_WORKERS", "1"))
+    
     # CORS Configuration
     CORS_ORIGINS = [
         "http://localhost:3000",
@@ -130,6 +175,13 @@ class Config:
         "http://127.0.0.1:3001"
     ]
     
+    # Session Store Configuration
+    # "memory" keeps sessions in-process; "redis" shares them across workers
+    SESSION_STORE = os.getenv("SESSION_STORE", "memory")
+    REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "3600"))
+    SESSION_HISTORY_MAX_TURNS = int(os.getenv("SESSION_HISTORY_MAX_TURNS", "50"))
+    
     @classmethod
     def validate_config(cls):
         """Validate that required configuration is present"""
@@ -145,4 +197,9 @@ class Config:
         if missing_fields:
             raise ValueError(f"Missing required configuration: {', '.join(missing_fields)}")
         
+        # In-memory sessions live in one process, so with several workers a
+        # session's turns would land on workers that never saw it
+        if not cls.API_RELOAD and cls.API_WORKERS > 1 and cls.SESSION_STORE == "memory":
+            raise ValueError("API_WORKERS > 1 requires SESSION_STORE=redis; in-memory sessions are not shared between workers")
+        
         return True
@@ -0,0 +1,16 @@
+"""
+Demo Console - Shared console setup for the demo scripts
+
+The demo scripts print emoji. On legacy (e.g. cp1252) consoles these
+cannot be encoded, so unencodable characters are printed as '?' rather
+than raising UnicodeEncodeError.
+"""
+
+# Standard library imports
+import sys
+
+
+def tolerate_unencodable_output():
+    """Print unencodable characters as '?' instead of raising"""
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(errors="replace")
@@ -0,0 +1,48 @@
+"""
+Demo Ticket Cache - Optional replay of create_ticket results for the demo scripts
+
+Set TEST_LLM_CACHE=1 to replay create_ticket results from earlier runs
+instead of calling the model again. Results are keyed by a hash of the
+user and the exact request text, and saved to .test_llm_cache.json next
+to this file when the process exits.
+"""
+
+# Standard library imports
+import atexit
+import hashlib
+import json
+import os
+import threading
+
+_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".test_llm_cache.json")
+_cache = None
+_lock = threading.Lock()
+
+
+def _save_cache():
+    with open(_CACHE_PATH, "w") as f:
+        json.dump(_cache, f, default=str)
+
+
+def _load_cache():
+    global _cache
+    with _lock:
+        if _cache is None:
+            try:
+                with open(_CACHE_PATH) as f:
+                    _cache = json.load(f)
+            except (OSError, ValueError):
+                _cache = {}
+            atexit.register(_save_cache)
+    return _cache
+
+
+def cached_create_ticket(agent, request, user):
+    """Create a ticket, reusing a cached result when TEST_LLM_CACHE=1"""
+    if os.getenv("TEST_LLM_CACHE") != "1":
+        return agent.create_ticket(request, user)
+    cache = _load_cache()
+    key = hashlib.sha256(f"{user}|{request}".encode()).hexdigest()
+    if key not in cache:
+        cache[key] = agent.create_ticket(request, user)
+    return cache[key]
@@ -25,6 +25,8 @@ Version: 1.0.0
 """
 
 # Standard library imports
+import functools
+import secrets
 import uvicorn
 from contextlib import asynccontextmanager
 from datetime import datetime
@@ -33,6 +35,8 @@ from typing import Optional, Dict, Any
 # Third-party imports
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
 from pydantic import BaseModel
 
 # Local imports
@@ -52,6 +56,13 @@ ticket_creation_agent: Optional[TicketCreationAgent] = None
 chatbot_service: Optional[HybridChatbotService] = None
 
 
+@functools.lru_cache(maxsize=1)
+def get_core_search_agent():
+    """Return the Core Search Agent shared by the test endpoints, built on first use"""
+    from agents.core_search_agent import CoreSearchAgent
+    return CoreSearchAgent()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -120,7 +131,8 @@ async def lifespan(app: FastAPI):
     
     # Cleanup on shutdown
     print("🔄 Shutting down agents and services...")
-    # Additional cleanup logic can be added here if needed
+    if chatbot_service:
+        await chatbot_service.close()
 
 
 # Create FastAPI app with comprehensive metadata
@@ -129,6 +141,7 @@ app = FastAPI(
     description="RESTful API for ServiceNow chatbot with OCI AI integration",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
@@ -167,9 +180,14 @@ class EnhancedChatMessage(BaseModel):
     Attributes:
         message (str): The user's chat message content
         session_data (Optional[Dict[str, Any]]): Session state and context
+        session_id (Optional[str]): Key for server-side session state; when
+                                    set, session_data may be omitted and is
+                                    not sent back. A new id is issued when
+                                    none is sent
     """
     message: str
     session_data: Optional[Dict[str, Any]] = None
+    session_id: Optional[str] = None
 
 
 class SearchRequest(BaseModel):
@@ -325,7 +343,7 @@ async def test_enhanced_chat():
             return {"error": "Chatbot service not initialized"}
         
         test_message = "Hello, I need help with my laptop"
-        result = chatbot_service.process_message(test_message)
+        result = await chatbot_service.process_message(test_message)
         return {
             "status": "success",
             "result": result
@@ -354,8 +372,7 @@ async def test_knowledge_search():
             return {"error": "Chatbot service not initialized"}
         
         # Test knowledge base search directly using Core Search Agent
-        from agents.core_search_agent import CoreSearchAgent
-        search_agent = CoreSearchAgent()
+        search_agent = get_core_search_agent()
         result = search_agent.search("Windows", "knowledge")
         
         return {
@@ -390,7 +407,7 @@ async def test_enhanced_chat():
         if not chatbot_service:
             return {"error": "Chatbot service not initialized"}
         
-        result = chatbot_service.process_message("Hello, I need help with my laptop")
+        result = await chatbot_service.process_message("Hello, I need help with my laptop")
         return {
             "status": "success",
             "result": result
@@ -410,8 +427,7 @@ async def test_knowledge_search():
             return {"error": "Chatbot service not initialized"}
         
         # Test knowledge base search directly using Core Search Agent
-        from agents.core_search_agent import CoreSearchAgent
-        search_agent = CoreSearchAgent()
+        search_agent = get_core_search_agent()
         result = search_agent.search("Windows", "knowledge")
         
         return {
@@ -433,8 +449,7 @@ async def test_search_all():
             return {"error": "Chatbot service not initialized"}
         
         # Test search using Core Search Agent
-        from agents.core_search_agent import CoreSearchAgent
-        search_agent = CoreSearchAgent()
+        search_agent = get_core_search_agent()
         result = search_agent.search("Windows", "mixed")
         
         return {
@@ -619,6 +634,25 @@ async def chat(chat_message: ChatMessage):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing chat: {str(e)}")
 
+def _new_session_id() -> str:
+    """Issue an unguessable key for server-side session state"""
+    return secrets.token_urlsafe(16)
+
+
+def _session_fields(chat_message: EnhancedChatMessage, session_id: str,
+                    session_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Session part of an enhanced chat response.
+    
+    Clients that sent a session id keep their state on the server and only
+    get the id back; others also receive the full session_data, as before,
+    along with the id they can send from now on.
+    """
+    if chat_message.session_id:
+        return {"session_id": session_id}
+    return {"session_data": session_data, "session_id": session_id}
+
+
 # Enhanced chat endpoint with intent detection and structured data collection
 @app.post("/chat/enhanced")
 async def enhanced_chat(chat_message: EnhancedChatMessage):
@@ -628,11 +662,14 @@ async def enhanced_chat(chat_message: EnhancedChatMessage):
             raise HTTPException(status_code=500, detail="Chatbot service not initialized")
         
         # Process message with chatbot service
-        result = chatbot_service.process_message(chat_message.message, chat_message.session_data)
+        session_id = chat_message.session_id or _new_session_id()
+        result = await chatbot_service.process_message(
+            chat_message.message, chat_message.session_data, session_id
+        )
         
         return {
             "response": result["response"],
-            "session_data": result["session_data"],
+            **_session_fields(chat_message, session_id, result["session_data"]),
             "next_action": result["next_action"],
             "message_type": result["message_type"],
             "status": "success"
@@ -642,6 +679,42 @@ async def enhanced_chat(chat_message: EnhancedChatMessage):
         raise HTTPException(status_code=500, detail=f"Error processing enhanced chat: {str(e)}")
 
 
+@app.post("/chat/enhanced/stream")
+async def enhanced_chat_stream(chat_message: EnhancedChatMessage):
+    """
+    Streaming variant of /chat/enhanced using Server-Sent Events.
+    
+    Emits ``response_delta`` events while a follow-up answer is generated,
+    then one final event with the same fields as /chat/enhanced plus
+    ``done: true``.
+    """
+    if not chatbot_service:
+        raise HTTPException(status_code=500, detail="Chatbot service not initialized")
+    
+    session_id = chat_message.session_id or _new_session_id()
+    
+    async def event_stream():
+        try:
+            async for event in chatbot_service.stream_message(
+                chat_message.message, chat_message.session_data, session_id
+            ):
+                if event.get('done'):
+                    event = {
+                        "response": event["response"],
+                        **_session_fields(chat_message, session_id, event["session_data"]),
+                        "next_action": event["next_action"],
+                        "message_type": event["message_type"],
+                        "status": "success",
+                        "done": True
+                    }
+                yield b"data: " + orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
+        except Exception as e:
+            error = {"status": "error", "detail": f"Error processing enhanced chat: {str(e)}", "done": True}
+            yield b"data: " + orjson.dumps(error) + b"\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 # Search-specific endpoints
 @app.post("/search")
 async def search(search_request: SearchRequest):
@@ -733,9 +806,14 @@ async def handle_duplicate_decision(request: DuplicateDecisionRequest):
 
 
 if __name__ == "__main__":
+    # Refuse a configuration the workers would only reject one by one
+    Config.validate_config()
+    
+    # uvicorn[standard] runs on uvloop and httptools when they are installed
     uvicorn.run(
         "main:app",
         host=Config.API_HOST,
         port=Config.API_PORT,
-        reload=True
+        reload=Config.API_RELOAD,
+        workers=None if Config.API_RELOAD else Config.API_WORKERS
     )
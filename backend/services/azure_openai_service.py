@@ -3,9 +3,54 @@ Azure OpenAI Service for Intent Detection and General AI Tasks
 """
 import json
 import os
-from typing import Dict, Any, Optional, List
-from openai import AzureOpenAI
+
+import httpx
+from typing import AsyncIterator, Optional, List, Tuple
+from openai import AsyncAzureOpenAI, AzureOpenAI
 from config.config import Config
+from config.logging_config import get_logger
+from services.intent_batch import BATCH_RESPONSE_FORMAT, format_batch_messages, match_batch_response
+from services.intent_result import IntentResult
+from services.keyword_intent import detect_keyword_intent
+
+# Initialize logger
+logger = get_logger("azure_openai_service")
+
+# Static classification instructions are sent as the system message so every
+# intent request shares an identical prefix that Azure can cache; only the
+# recent history and the user's message vary, and they come last.
+_INTENT_CATEGORIES = """1. Incident - Something is broken or not working
+2. Request - Requesting a new service, access, or resource
+3. Change - Requesting to modify existing systems or processes
+4. Problem - Recurring issues or root cause analysis
+5. Status - Checking status of existing tickets
+6. Knowledge - Looking for information or documentation
+7. Other - General questions or unclear intent
+"""
+
+_INTENT_SYSTEM_PROMPT = f"""You are an expert IT support intent classifier. Always respond with valid JSON.
+
+Classify the user's message into one of these categories:
+
+{_INTENT_CATEGORIES}
+Respond with a JSON object containing:
+- intent: one of the categories above
+- confidence: number between 0.0 and 1.0
+- rationale: brief explanation of why this intent was chosen
+
+Examples:
+- "My laptop won't start" → {{"intent": "Incident", "confidence": 0.9, "rationale": "Hardware failure requiring immediate attention"}}
+- "I need access to the database" → {{"intent": "Request", "confidence": 0.8, "rationale": "Requesting new access permissions"}}
+- "Can you help me understand how to reset passwords?" → {{"intent": "Knowledge", "confidence": 0.7, "rationale": "Seeking procedural information"}}
+"""
+
+_BATCH_INTENT_SYSTEM_PROMPT = f"""You are an expert IT support intent classifier. Always respond with valid JSON.
+
+Classify each message, sent by independent users, into one of these categories:
+
+{_INTENT_CATEGORIES}
+{BATCH_RESPONSE_FORMAT}"""
+
 
 class AzureOpenAIService:
     """Service for Azure OpenAI integration"""
@@ -18,7 +63,7 @@ class AzureOpenAIService:
         self.deployment_name = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4")
         
         if not all([self.api_key, self.endpoint, self.deployment_name]):
-            print("⚠️ Azure OpenAI configuration incomplete, using fallback")
+            logger.warning("⚠️ Azure OpenAI configuration incomplete, using fallback")
             self.client = None
             self.use_azure = False
         else:
@@ -29,66 +74,34 @@ class AzureOpenAIService:
                     azure_endpoint=self.endpoint
                 )
                 self.use_azure = True
-                print("✅ Azure OpenAI client initialized")
+                logger.info("✅ Azure OpenAI client initialized")
             except Exception as e:
-                print(f"⚠️ Azure OpenAI client initialization failed: {e}")
+                logger.warning("⚠️ Azure OpenAI client initialization failed: %s", e)
                 self.client = None
                 self.use_azure = False
     
-    def detect_intent(self, user_message: str, conversation_history: List[Dict] = None) -> Dict[str, Any]:
+    def detect_intent(self, user_message: str, conversation_history: List[Tuple[str, str]] = None) -> IntentResult:
         """
         Detect user intent using Azure OpenAI
         
         Args:
             user_message (str): User's message
-            conversation_history (list): Previous conversation context
+            conversation_history (list): Previous (role, content) turns
             
         Returns:
-            Dict with intent, confidence, and rationale
+            IntentResult with intent, confidence, and rationale
         """
         try:
             if not self.use_azure:
                 return self._fallback_intent_detection(user_message)
             
-            # Build context from conversation history
-            context = ""
-            if conversation_history:
-                context = "Previous conversation:\n"
-                for msg in conversation_history[-3:]:  # Last 3 messages for context
-                    context += f"{msg.get('role', 'user')}: {msg.get('content', '')}\n"
+            prompt = self._build_intent_prompt(user_message, conversation_history)
             
-            prompt = f"""
-You are an IT support intent classifier. Analyze the user's message and classify it into one of these categories:
-
-1. Incident - Something is broken or not working
-2. Request - Requesting a new service, access, or resource
-3. Change - Requesting to modify existing systems or processes
-4. Problem - Recurring issues or root cause analysis
-5. Status - Checking status of existing tickets
-6. Knowledge - Looking for information or documentation
-7. Other - General questions or unclear intent
-
-{context}
-
-User message: "{user_message}"
-
-Respond with a JSON object containing:
-- intent: one of the categories above
-- confidence: number between 0.0 and 1.0
-- rationale: brief explanation of why this intent was chosen
-
-Examples:
-- "My laptop won't start" → {{"intent": "Incident", "confidence": 0.9, "rationale": "Hardware failure requiring immediate attention"}}
-- "I need access to the database" → {{"intent": "Request", "confidence": 0.8, "rationale": "Requesting new access permissions"}}
-- "Can you help me understand how to reset passwords?" → {{"intent": "Knowledge", "confidence": 0.7, "rationale": "Seeking procedural information"}}
-
-JSON response:"""
-
             # Call Azure OpenAI
             response = self.client.chat.completions.create(
                 model=self.deployment_name,
                 messages=[
-                    {"role": "system", "content": "You are an expert IT support intent classifier. Always respond with valid JSON."},
+                    {"role": "system", "content": _INTENT_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=200,
@@ -97,31 +110,10 @@ JSON response:"""
             
             # Parse the response
             response_text = response.choices[0].message.content.strip()
-            
-            # Extract JSON from response
-            try:
-                # Find JSON in the response
-                start_idx = response_text.find('{')
-                end_idx = response_text.rfind('}') + 1
-                if start_idx != -1 and end_idx != -1:
-                    json_str = response_text[start_idx:end_idx]
-                    result = json.loads(json_str)
-                    
-                    # Validate the result
-                    if all(key in result for key in ['intent', 'confidence', 'rationale']):
-                        return {
-                            'intent': result['intent'],
-                            'confidence': float(result['confidence']),
-                            'rationale': result['rationale']
-                        }
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                print(f"Error parsing Azure OpenAI response: {e}")
-            
-            # Fallback to simple keyword-based detection
-            return self._fallback_intent_detection(user_message)
+            return self._parse_intent_response(response_text, user_message)
             
         except Exception as e:
-            print(f"Error in Azure OpenAI intent detection: {e}")
+            logger.warning("Error in Azure OpenAI intent detection: %s", e)
             return self._fallback_intent_detection(user_message)
     
     def generate_response(self, prompt: str, context: str = None) -> str:
@@ -154,36 +146,249 @@ JSON response:"""
             return response.choices[0].message.content.strip()
             
         except Exception as e:
-            print(f"Error in Azure OpenAI response generation: {e}")
+            logger.warning("Error in Azure OpenAI response generation: %s", e)
             return "I'm sorry, I'm having trouble generating a response right now."
     
-    def _fallback_intent_detection(self, user_message: str) -> Dict[str, Any]:
+    def _build_intent_prompt(self, user_message: str, conversation_history: List[Tuple[str, str]] = None) -> str:
+        """Build the intent classification prompt for a user message"""
+        # Build context from conversation history
+        context = ""
+        if conversation_history:
+            context = "Previous conversation:\n"
+            for role, content in conversation_history[-3:]:  # Last 3 messages for context
+                context += f"{role}: {content}\n"
+        
+        return f"""{context}
+User message: "{user_message}"
+
+JSON response:"""
+    
+    def _parse_intent_response(self, response_text: str, user_message: str) -> IntentResult:
+        """Parse the classifier JSON, falling back to keyword detection"""
+        # Extract JSON from response
+        try:
+            # Find JSON in the response
+            start_idx = response_text.find('{')
+            end_idx = response_text.rfind('}') + 1
+            if start_idx != -1 and end_idx != -1:
+                json_str = response_text[start_idx:end_idx]
+                result = json.loads(json_str)
+                
+                # Validate the result
+                if all(key in result for key in ['intent', 'confidence', 'rationale']):
+                    return IntentResult.from_llm(result)
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            logger.warning("Error parsing Azure OpenAI response: %s", e)
+        
+        # Fallback to simple keyword-based detection
+        return self._fallback_intent_detection(user_message)
+    
+    def _build_batch_intent_prompt(self, items: List[Tuple[str, Optional[List[Tuple[str, str]]]]]) -> str:
+        """Build one classification prompt covering several messages"""
+        return f"""Messages:
+{format_batch_messages(items)}
+
+JSON response:"""
+    
+    def _parse_batch_intent_response(self, response_text: str, messages: List[str]) -> List[IntentResult]:
+        """Parse a JSON array of classifications, matched to the messages by id"""
+        matched = match_batch_response(response_text, len(messages))
+        if matched is None:
+            logger.warning("Azure OpenAI batch response did not classify each message exactly once")
+            return [self._fallback_intent_detection(m) for m in messages]
+        
+        results = []
+        for user_message, item in zip(messages, matched):
+            try:
+                results.append(IntentResult.from_llm(item))
+            except (TypeError, KeyError, ValueError):
+                results.append(self._fallback_intent_detection(user_message))
+        return results
+    
+    def _fallback_intent_detection(self, user_message: str) -> IntentResult:
         """Fallback keyword-based intent detection"""
-        message_lower = user_message.lower()
+        return detect_keyword_intent(user_message)
+
+
+class AsyncAzureOpenAIService(AzureOpenAIService):
+    """
+    Non-blocking variant of the Azure OpenAI service.
+    
+    Exposes the same ``detect_intent`` / ``generate_response`` API as
+    coroutines backed by ``AsyncAzureOpenAI``, so an Azure round trip
+    awaited on the FastAPI event loop does not hold up other sessions'
+    requests.
+    """
+    
+    def __init__(self):
+        super().__init__()
         
-        # Incident keywords
-        incident_keywords = ['broken', 'not working', 'error', 'failed', 'down', 'issue', 'problem', 'crash', 'hang']
-        if any(keyword in message_lower for keyword in incident_keywords):
-            return {'intent': 'Incident', 'confidence': 0.7, 'rationale': 'Detected incident keywords'}
+        if self.use_azure:
+            try:
+                # One pooled HTTP/2 client keeps TLS connections warm and
+                # multiplexes concurrent sessions' requests over them
+                self.client = AsyncAzureOpenAI(
+                    api_key=self.api_key,
+                    api_version=self.api_version,
+                    azure_endpoint=self.endpoint,
+                    http_client=httpx.AsyncClient(
+                        http2=True,
+                        limits=httpx.Limits(
+                            max_connections=Config.AZURE_OPENAI_MAX_CONNECTIONS,
+                            max_keepalive_connections=Config.AZURE_OPENAI_MAX_KEEPALIVE
+                        )
+                    )
+                )
+            except Exception as e:
+                logger.warning("⚠️ Async Azure OpenAI client initialization failed: %s", e)
+                self.client = None
+                self.use_azure = False
+    
+    async def close(self):
+        """Close the pooled HTTP connections"""
+        if self.client is not None:
+            await self.client.close()
+    
+    async def detect_intent(self, user_message: str, conversation_history: List[Tuple[str, str]] = None) -> IntentResult:
+        """
+        Detect user intent using Azure OpenAI without blocking the event loop
         
-        # Request keywords
-        request_keywords = ['need', 'want', 'request', 'access', 'permission', 'account', 'user']
-        if any(keyword in message_lower for keyword in request_keywords):
-            return {'intent': 'Request', 'confidence': 0.6, 'rationale': 'Detected request keywords'}
+        Args:
+            user_message (str): User's message
+            conversation_history (list): Previous (role, content) turns
+            
+        Returns:
+            IntentResult with intent, confidence, and rationale
+        """
+        try:
+            if not self.use_azure:
+                return self._fallback_intent_detection(user_message)
+            
+            prompt = self._build_intent_prompt(user_message, conversation_history)
+            
+            response = await self.client.chat.completions.create(
+                model=self.deployment_name,
+                messages=[
+                    {"role": "system", "content": _INTENT_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=200,
+                temperature=0.1
+            )
+            
+            response_text = response.choices[0].message.content.strip()
+            return self._parse_intent_response(response_text, user_message)
+            
+        except Exception as e:
+            logger.warning("Error in Azure OpenAI intent detection: %s", e)
+            return self._fallback_intent_detection(user_message)
+    
+    async def detect_intents_batch(self, items: List[Tuple[str, Optional[List[Tuple[str, str]]]]]) -> List[IntentResult]:
+        """
+        Classify several user messages with a single Azure chat completion
+        
+        Args:
+            items (list): (user_message, conversation_history) pairs
+            
+        Returns:
+            List of IntentResults in the same order as ``items``. Entries the
+            model did not return a valid classification for fall back to
+            keyword-based detection.
+        """
+        messages = [message for message, _ in items]
+        try:
+            if not self.use_azure:
+                return [self._fallback_intent_detection(m) for m in messages]
+            
+            prompt = self._build_batch_intent_prompt(items)
+            
+            response = await self.client.chat.completions.create(
+                model=self.deployment_name,
+                messages=[
+                    {"role": "system", "content": _BATCH_INTENT_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=120 * len(items),
+                temperature=0.1
+            )
+            
+            response_text = response.choices[0].message.content.strip()
+            return self._parse_batch_intent_response(response_text, messages)
+            
+        except Exception as e:
+            logger.warning("Error in Azure OpenAI batch intent detection: %s", e)
+            return [self._fallback_intent_detection(m) for m in messages]
+    
+    async def generate_response(self, prompt: str, context: str = None) -> str:
+        """
+        Generate a response using Azure OpenAI without blocking the event loop
         
-        # Change keywords
-        change_keywords = ['change', 'modify', 'update', 'upgrade', 'migrate', 'deploy']
-        if any(keyword in message_lower for keyword in change_keywords):
-            return {'intent': 'Change', 'confidence': 0.6, 'rationale': 'Detected change keywords'}
+        Args:
+            prompt (str): The prompt to send
+            context (str): Additional context
+            
+        Returns:
+            Generated response text
+        """
+        try:
+            if not self.use_azure:
+                return "Azure OpenAI not available"
+            
+            messages = []
+            if context:
+                messages.append({"role": "system", "content": context})
+            messages.append({"role": "user", "content": prompt})
+            
+            response = await self.client.chat.completions.create(
+                model=self.deployment_name,
+                messages=messages,
+                max_tokens=500,
+                temperature=0.7
+            )
+            
+            return response.choices[0].message.content.strip()
+            
+        except Exception as e:
+            logger.warning("Error in Azure OpenAI response generation: %s", e)
+            return "I'm sorry, I'm having trouble generating a response right now."
+    
+    async def stream_response(self, prompt: str, context: str = None) -> AsyncIterator[str]:
+        """
+        Generate a response using Azure OpenAI, yielding text as it arrives
         
-        # Status keywords
-        status_keywords = ['status', 'check', 'ticket', 'progress', 'update']
-        if any(keyword in message_lower for keyword in status_keywords):
-            return {'intent': 'Status', 'confidence': 0.7, 'rationale': 'Detected status keywords'}
+        Args:
+            prompt (str): The prompt to send
+            context (str): Additional context
+            
+        Yields:
+            Response text deltas, in order
+        """
+        if not self.use_azure:
+            yield "Azure OpenAI not available"
+            return
         
-        # Knowledge keywords
-        knowledge_keywords = ['how', 'what', 'where', 'when', 'why', 'help', 'guide', 'documentation']
-        if any(keyword in message_lower for keyword in knowledge_keywords):
-            return {'intent': 'Knowledge', 'confidence': 0.6, 'rationale': 'Detected knowledge keywords'}
+        messages = []
+        if context:
+            messages.append({"role": "system", "content": context})
+        messages.append({"role": "user", "content": prompt})
         
-        return {'intent': 'Other', 'confidence': 0.3, 'rationale': 'Unable to determine specific intent'}
+        streamed = False
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.deployment_name,
+                messages=messages,
+                max_tokens=500,
+                temperature=0.7,
+                stream=True
+            )
+            
+            async for chunk in stream:
+                # Azure sends content-filter chunks with no choices
+                if chunk.choices and chunk.choices[0].delta.content:
+                    streamed = True
+                    yield chunk.choices[0].delta.content
+                    
+        except Exception as e:
+            logger.warning("Error in Azure OpenAI response streaming: %s", e)
+            if not streamed:
+                yield "I'm sorry, I'm having trouble generating a response right now."
@@ -2,7 +2,7 @@
 Main Chatbot Service that orchestrates intent detection, conversation management, and search
 """
 from typing import Dict, Any, List, Optional
-from services.intent_detection import IntentDetectionService
+from services.intent_detection import get_intent_service
 from services.conversation_manager import ConversationManager, IntentType
 from agents.oci_compliant_core_search_agent import OciCompliantCoreSearchAgent
 import json
@@ -11,7 +11,7 @@ class ChatbotService:
     """Main chatbot service that handles the complete conversation flow"""
     
     def __init__(self):
-        self.intent_detector = IntentDetectionService()
+        self.intent_detector = get_intent_service()
         self.conversation_manager = ConversationManager()
         # Note: OciCompliantCoreSearchAgent requires AgentClient
         # For now, keeping existing functionality
@@ -67,16 +67,16 @@ class ChatbotService:
             # Detect intent from the first message
             intent_result = self.intent_detector.detect_intent(message, session_data['conversation_history'])
             
-            session_data['intent'] = intent_result['intent']
-            session_data['confidence'] = intent_result['confidence']
-            session_data['rationale'] = intent_result['rationale']
+            session_data['intent'] = intent_result.intent
+            session_data['confidence'] = intent_result.confidence
+            session_data['rationale'] = intent_result.rationale
             
             # If confidence is good, move to data collection
-            if intent_result['confidence'] >= 0.5:
+            if intent_result.confidence >= 0.5:
                 session_data['conversation_stage'] = 'data_collection'
                 next_question = self.conversation_manager.get_next_question(session_data)
                 
-                response = f"Got it! I understand you need help with **{intent_result['intent']}** issues. {intent_result['rationale']}\n\n"
+                response = f"Got it! I understand you need help with **{intent_result.intent}** issues. {intent_result.rationale}\n\n"
                 response += f"{next_question}"
                 
                 return {
@@ -88,9 +88,9 @@ class ChatbotService:
             else:
                 # Low confidence, ask for clarification
                 session_data['conversation_stage'] = 'intent_detection'
-                clarification_question = self._get_clarification_question(intent_result['intent'])
+                clarification_question = self._get_clarification_question(intent_result.intent)
                 return {
-                    'response': f"I think you might be asking about **{intent_result['intent']}** issues, but I'm not completely sure. {clarification_question}",
+                    'response': f"I think you might be asking about **{intent_result.intent}** issues, but I'm not completely sure. {clarification_question}",
                     'session_data': session_data,
                     'next_action': 'wait_for_clarification',
                     'message_type': 'clarification'
@@ -112,15 +112,15 @@ class ChatbotService:
         # Detect intent
         intent_result = self.intent_detector.detect_intent(message, session_data['conversation_history'])
         
-        session_data['intent'] = intent_result['intent']
-        session_data['confidence'] = intent_result['confidence']
-        session_data['rationale'] = intent_result['rationale']
+        session_data['intent'] = intent_result.intent
+        session_data['confidence'] = intent_result.confidence
+        session_data['rationale'] = intent_result.rationale
         
         # If confidence is low, ask for clarification
-        if intent_result['confidence'] < 0.5:
-            clarification_question = self._get_clarification_question(intent_result['intent'])
+        if intent_result.confidence < 0.5:
+            clarification_question = self._get_clarification_question(intent_result.intent)
             return {
-                'response': f"I think you might be asking about **{intent_result['intent']}** issues, but I'm not completely sure. {clarification_question}",
+                'response': f"I think you might be asking about **{intent_result.intent}** issues, but I'm not completely sure. {clarification_question}",
                 'session_data': session_data,
                 'next_action': 'wait_for_clarification',
                 'message_type': 'clarification'
@@ -132,7 +132,7 @@ class ChatbotService:
         # Get first question
         next_question = self.conversation_manager.get_next_question(session_data)
         
-        response = f"Got it! I understand you need help with **{intent_result['intent']}** issues. {intent_result['rationale']}\n\n"
+        response = f"Got it! I understand you need help with **{intent_result.intent}** issues. {intent_result.rationale}\n\n"
         response += f"{next_question}"
         
         return {
@@ -150,11 +150,14 @@ class ChatbotService:
         if next_question:
             # Extract field name from the question
             field_name = self._extract_field_from_question(next_question, session_data['intent'])
+            changed = False
             if field_name:
-                session_data = self.conversation_manager.update_session_data(session_data, field_name, message)
+                session_data, changed = self.conversation_manager.update_session_data(session_data, field_name, message)
             
-            # Get next question
-            next_question = self.conversation_manager.get_next_question(session_data)
+            # Get next question, unless nothing was recorded and the
+            # current one still applies
+            if changed:
+                next_question = self.conversation_manager.get_next_question(session_data)
             
             if next_question:
                 # Show confirmation of what was collected
@@ -1,7 +1,7 @@
 """
 Conversation Manager for handling structured data collection
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
 import json
 
@@ -14,6 +14,57 @@ class IntentType(Enum):
     KNOWLEDGE = "Knowledge"
     OTHER = "Other"
 
+class ConversationHistory:
+    """
+    Columnar (struct-of-arrays) view over a session's conversation history.
+    
+    The history is stored in ``session_data['conversation_history']`` as a
+    JSON-serializable dict of parallel lists (``roles``, ``contents``,
+    ``timestamps``) so it survives the round trip through the frontend.
+    This wrapper appends to and slices those columns in place.
+    """
+    
+    __slots__ = ('columns',)
+    
+    def __init__(self, columns: Dict[str, List[str]]):
+        self.columns = columns
+    
+    @staticmethod
+    def empty_columns() -> Dict[str, List[str]]:
+        """Return the storage layout for a new, empty history"""
+        return {'roles': [], 'contents': [], 'timestamps': []}
+    
+    @classmethod
+    def attach(cls, session_data: Dict[str, Any]) -> 'ConversationHistory':
+        """
+        Wrap the session's history, converting legacy list-of-dict records
+        (sent by older clients) to the columnar layout.
+        """
+        history = session_data.get('conversation_history')
+        if not isinstance(history, dict):
+            columns = cls.empty_columns()
+            for msg in history or []:
+                columns['roles'].append(msg.get('role', 'user'))
+                columns['contents'].append(msg.get('content', ''))
+                columns['timestamps'].append(msg.get('timestamp', ''))
+            session_data['conversation_history'] = columns
+            history = columns
+        return cls(history)
+    
+    def append(self, role: str, content: str, timestamp: str):
+        """Record one turn"""
+        self.columns['roles'].append(role)
+        self.columns['contents'].append(content)
+        self.columns['timestamps'].append(timestamp)
+    
+    def recent(self, n: int) -> List[Tuple[str, str]]:
+        """Return the last ``n`` turns as (role, content) pairs"""
+        return list(zip(self.columns['roles'][-n:], self.columns['contents'][-n:]))
+    
+    def __len__(self) -> int:
+        return len(self.columns['roles'])
+
+
 class ConversationManager:
     """Manages conversation flow and data collection for different intents"""
     
@@ -92,31 +143,26 @@ class ConversationManager:
                 "environment": "What environment are you working in?"
             }
         }
+        
+        # Questions in asking order (required, then optional) per intent
+        # value, so each turn is a single scan with no enum conversion
+        self._question_order = {
+            intent.value: tuple(
+                (field, self.field_questions[intent].get(field, f"Please provide {field.replace('_', ' ')}"))
+                for field in self.required_fields.get(intent, []) + self.optional_fields.get(intent, [])
+            )
+            for intent in self.required_fields
+        }
     
     def get_next_question(self, session_data: Dict[str, Any]) -> Optional[str]:
         """Get the next question to ask based on current session data"""
         intent = session_data.get('intent')
         collected_data = session_data.get('collected_data', {})
         
-        if not intent:
-            return None
-        
-        try:
-            intent_enum = IntentType(intent)
-        except ValueError:
-            return None
-        
-        # Check required fields first
-        required = self.required_fields.get(intent_enum, [])
-        for field in required:
-            if field not in collected_data or not collected_data[field]:
-                return self.field_questions[intent_enum].get(field, f"Please provide {field.replace('_', ' ')}")
-        
-        # Check optional fields
-        optional = self.optional_fields.get(intent_enum, [])
-        for field in optional:
-            if field not in collected_data or not collected_data[field]:
-                return self.field_questions[intent_enum].get(field, f"Please provide {field.replace('_', ' ')}")
+        # Required fields come first, then optional ones
+        for field, question in self._question_order.get(intent, ()):
+            if not collected_data.get(field):
+                return question
         
         return None  # All fields collected
     
@@ -136,13 +182,20 @@ class ConversationManager:
         required = self.required_fields.get(intent_enum, [])
         return all(field in collected_data and collected_data[field] for field in required)
     
-    def update_session_data(self, session_data: Dict[str, Any], field: str, value: str) -> Dict[str, Any]:
-        """Update session data with new field value"""
+    def update_session_data(self, session_data: Dict[str, Any], field: str, value: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Update session data with new field value
+        
+        Returns:
+            Tuple of the session data and whether the stored value changed,
+            so callers can skip recomputing the next question when it did not
+        """
         if 'collected_data' not in session_data:
             session_data['collected_data'] = {}
         
+        changed = session_data['collected_data'].get(field) != value
         session_data['collected_data'][field] = value
-        return session_data
+        return session_data, changed
     
     def get_data_summary(self, session_data: Dict[str, Any]) -> str:
         """Generate a summary of collected data"""
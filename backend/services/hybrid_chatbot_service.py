@@ -35,17 +35,119 @@ Business Logic:
 """
 
 # Standard library imports
-import json
-from typing import Dict, Any, List, Optional
+import asyncio
+import re
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Any, List, Optional, Tuple
 
 # Local imports
-from agents.oci_compliant_core_search_agent import OciCompliantCoreSearchAgent
-from agents.search_agent import SearchAgent
-from agents.search_orchestrator import SearchOrchestrator
-from agents.ticket_agent import TicketAgent
-from agents.ticket_creation_agent import TicketCreationAgent
-from services.azure_openai_service import AzureOpenAIService
-from services.conversation_manager import ConversationManager, IntentType
+# Agents are injected by the caller and the Azure SDK is loaded on first
+# construction, so importing this module does not pull in the OCI, Google
+# ADK or OpenAI SDKs
+from config.config import Config
+from services.conversation_manager import ConversationHistory, ConversationManager, IntentType
+from services.intent_batcher import BatchingIntentDetector
+from services.intent_cache import IntentCache
+from services.intent_result import IntentResult
+from services.keyword_intent import detect_keyword_intent, is_keyword_result
+from services.search_cache import SearchResultCache
+from services.session_store import create_session_store
+
+if TYPE_CHECKING:
+    from agents.search_agent import SearchAgent
+    from agents.ticket_agent import TicketAgent
+    from agents.ticket_creation_agent import TicketCreationAgent
+
+
+# Unambiguous phrases that identify an intent without an LLM round trip.
+# Each entry maps an intent to the confidence assigned when one of its
+# phrases occurs in the message as whole words ("is down" must not match
+# inside "this download").
+_FAST_INTENT_RULES = (
+    (IntentType.INCIDENT, 0.85, (
+        "won't start", "wont start", "not working", "stopped working",
+        "crashed", "keeps crashing", "is down", "error message",
+        "can't log in", "cannot log in", "can't connect", "cannot connect"
+    )),
+    (IntentType.REQUEST, 0.85, (
+        "need access", "request access", "requesting access",
+        "new laptop", "new account", "install software"
+    )),
+    (IntentType.CHANGE, 0.8, (
+        "change request", "schedule a change", "deploy to production"
+    )),
+    (IntentType.PROBLEM, 0.8, (
+        "root cause", "keeps happening", "recurring issue"
+    )),
+    (IntentType.STATUS, 0.9, (
+        "status of my ticket", "ticket status", "check the status",
+        "check status", "any update on my ticket"
+    )),
+    (IntentType.KNOWLEDGE, 0.8, (
+        "how do i", "how to", "where can i find", "documentation for"
+    )),
+)
+_FAST_INTENT_CONFIDENCE = {intent.value: confidence for intent, confidence, _ in _FAST_INTENT_RULES}
+_FAST_INTENT_RE = re.compile(
+    "|".join(
+        f"(?P<{intent.value}>\\b(?:" + "|".join(re.escape(p) for p in phrases) + ")\\b)"
+        for intent, _, phrases in _FAST_INTENT_RULES
+    ),
+    re.IGNORECASE
+)
+
+# Phrases that turn a message into a direct knowledge search
+_SEARCH_CMD_RE = re.compile(r'\b(search for|find|look for|show me)\b', re.IGNORECASE)
+
+# Question phrasings that identify which field a data-collection question
+# asks for, compiled into one alternation so a question is scanned once
+_FIELD_KEYWORDS = {
+    'brief description': 'short_description',
+    'what is the issue': 'short_description',
+    'more details': 'detailed_description',
+    'what\'s happening': 'detailed_description',
+    'who is affected': 'impact_scope',
+    'impact scope': 'impact_scope',
+    'how urgent': 'urgency',
+    'urgency level': 'urgency',
+    'what service': 'affected_service',
+    'affected system': 'affected_service',
+    'when did this': 'start_time',
+    'start time': 'start_time',
+    'how often': 'frequency',
+    'frequency': 'frequency'
+}
+_FIELD_KEYWORD_RE = re.compile("|".join(re.escape(kw) for kw in _FIELD_KEYWORDS))
+
+# Replies in the search_results stage that are commands rather than
+# follow-up questions for the LLM
+_NEW_SEARCH_COMMANDS = frozenset({'new search', 'search again', 'new query'})
+_TICKET_REQUEST_COMMANDS = frozenset({
+    'create ticket', 'submit ticket', 'log ticket', 'still need help',
+    'not helpful', 'didn\'t help'
+})
+
+_FOLLOW_UP_CONTEXT = (
+    "You are a helpful IT support assistant. The user has just received search "
+    "results and is asking a follow-up question. If the search results don't "
+    "help, suggest they can create a ticket."
+)
+
+# Shown in place of results when the search agent raises
+_SEARCH_FAILED = "Search failed: {}. Please try again or contact support."
+
+# Footer offering ticket creation, appended to search results and follow-ups
+_TICKET_OPTION_SUFFIX = "\n\n**If these results don't help solve your issue, you can type 'create ticket' to submit a formal request.**"
+_FOLLOW_UP_FALLBACK = (
+    "I'm here to help! Is there anything specific about the search results "
+    "you'd like to know more about?" + _TICKET_OPTION_SUFFIX
+)
+
+# Intents that route straight to the ticket creation agent
+_TICKET_INTENTS = frozenset({
+    'create_incident', 'create_request', 'create_change', 'create_problem',
+    'submit_ticket', 'log_issue', 'create_ticket', 'report_issue'
+})
 
 
 class HybridChatbotService:
@@ -58,7 +160,11 @@ class HybridChatbotService:
     AI services and backend systems.
     
     Attributes:
-        azure_openai (AzureOpenAIService): General AI conversation service
+        azure_openai (AsyncAzureOpenAIService): General AI conversation service
+        intent_batcher (BatchingIntentDetector): Batches intent detection across sessions
+        intent_cache (IntentCache): LRU cache of intent detection results
+        session_store (SessionStore): Server-side session state, keyed by session id
+        search_cache (SearchResultCache): LRU cache of formatted search results
         conversation_manager (ConversationManager): Session and context management
         search_service: OCI-based search service (when available)
         search_agent (SearchAgent): Knowledge search agent
@@ -67,6 +173,7 @@ class HybridChatbotService:
         
     Methods:
         process_message(): Main entry point for message processing
+        stream_message(): Streaming variant of process_message()
         _detect_intent(): Analyze user message for intent classification
         _handle_search_request(): Process knowledge search requests
         _handle_ticket_request(): Process ticket creation requests
@@ -86,9 +193,9 @@ class HybridChatbotService:
         - Service health monitoring and automatic recovery
     """
     
-    def __init__(self, search_agent: SearchAgent = None, 
-                 ticket_agent: TicketAgent = None, 
-                 ticket_creation_agent: TicketCreationAgent = None):
+    def __init__(self, search_agent: 'SearchAgent' = None, 
+                 ticket_agent: 'TicketAgent' = None, 
+                 ticket_creation_agent: 'TicketCreationAgent' = None):
         """
         Initialize the hybrid chatbot service with AI agents and services.
         
@@ -107,7 +214,15 @@ class HybridChatbotService:
             - All agents support hot-swapping for testing and development
         """
         # Initialize core AI services
-        self.azure_openai = AzureOpenAIService()
+        from services.azure_openai_service import AsyncAzureOpenAIService
+        self.azure_openai = AsyncAzureOpenAIService()
+        self.intent_batcher = BatchingIntentDetector(self.azure_openai)
+        self.intent_cache = IntentCache(maxsize=4096)
+        self.session_store = create_session_store()
+        self.search_cache = SearchResultCache(
+            maxsize=Config.SEARCH_CACHE_MAX_SIZE,
+            ttl_seconds=Config.SEARCH_CACHE_TTL_SECONDS
+        )
         self.conversation_manager = ConversationManager()
         
         # Initialize specialized agents
@@ -115,11 +230,21 @@ class HybridChatbotService:
         # Will be updated when AgentClient integration is complete
         self.search_service = None
         self.search_agent = search_agent
+        self._oci_sema = asyncio.Semaphore(Config.OCI_SEARCH_MAX_CONCURRENCY)
         self.ticket_agent = ticket_agent
         self.ticket_creation_agent = ticket_creation_agent
+        
+        # Conversation stage -> handler coroutine; unknown stages reset
+        self._stage_handlers = {
+            'greeting': self._handle_greeting,
+            'intent_detection': self._handle_intent_detection,
+            'data_collection': self._handle_data_collection,
+            'search_results': self._handle_search_results
+        }
     
-    def process_message(self, message: str, 
-                       session_data: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def process_message(self, message: str, 
+                       session_data: Dict[str, Any] = None,
+                       session_id: str = None) -> Dict[str, Any]:
         """
         Process user message using hybrid multi-AI approach.
         
@@ -130,6 +255,9 @@ class HybridChatbotService:
         Args:
             message (str): User's input message to process
             session_data (Dict[str, Any], optional): Current session context data
+            session_id (str, optional): Server-side session key. When given,
+                session_data is loaded from the session store if not sent,
+                and the updated session is saved back after processing
                 
         Returns:
             Dict[str, Any]: Comprehensive response containing:
@@ -154,13 +282,25 @@ class HybridChatbotService:
         Example:
             ```python
             service = HybridChatbotService()
-            result = service.process_message(
+            result = await service.process_message(
                 "My laptop won't start", 
                 {"user_id": "john.doe"}
             )
             print(result["response"])  # AI-generated helpful response
             ```
         """
+        if session_id is None:
+            return await self._process_message(message, session_data)
+        
+        if session_data is None:
+            session_data = await self.session_store.get(session_id)
+        result = await self._process_message(message, session_data)
+        if result.get('session_data') is not None:
+            await self.session_store.set(session_id, result['session_data'])
+        return result
+    
+    async def _process_message(self, message: str, session_data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Run one conversation turn against the given session state"""
         if session_data is None:
             session_data = {
                 'intent': None,
@@ -168,57 +308,114 @@ class HybridChatbotService:
                 'rationale': '',
                 'collected_data': {},
                 'conversation_stage': 'greeting',
-                'conversation_history': [],
+                'conversation_history': ConversationHistory.empty_columns(),
                 'ai_provider': 'azure_openai'  # Track which AI provider is being used
             }
         
         # Add message to conversation history
-        session_data['conversation_history'].append({
-            'role': 'user',
-            'content': message,
-            'timestamp': self._get_timestamp()
-        })
+        ConversationHistory.attach(session_data).append('user', message, self._get_timestamp())
         
         # Check for direct search commands first
         if self._is_direct_search_command(message):
-            return self._handle_direct_search(message, session_data)
+            return await self._handle_direct_search(message, session_data)
         
         # Handle different conversation stages
-        if session_data['conversation_stage'] == 'greeting':
-            return self._handle_greeting(message, session_data)
-        elif session_data['conversation_stage'] == 'intent_detection':
-            return self._handle_intent_detection(message, session_data)
-        elif session_data['conversation_stage'] == 'data_collection':
-            return self._handle_data_collection(message, session_data)
-        elif session_data['conversation_stage'] == 'search_results':
-            return self._handle_search_results(message, session_data)
-        else:
+        handler = self._stage_handlers.get(session_data['conversation_stage'])
+        if handler is None:
             return self._handle_unknown_stage(message, session_data)
+        return await handler(message, session_data)
+    
+    async def close(self):
+        """Stop background workers and release pooled connections"""
+        await self.intent_batcher.close()
+        await self.azure_openai.close()
+        await self.session_store.close()
+    
+    async def stream_message(self, message: str,
+                             session_data: Dict[str, Any] = None,
+                             session_id: str = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process user message, streaming the reply as it is generated.
+        
+        Follow-up questions asked after search results are answered with the
+        Azure OpenAI streaming API so the first tokens reach the user without
+        waiting for the full completion. Each text chunk is yielded as
+        ``{'response_delta': str}``; the last event is the same dict
+        process_message() returns, with ``done`` set to True. All other
+        stages yield only that final event.
+        
+        Args:
+            message (str): User's input message to process
+            session_data (Dict[str, Any], optional): Current session context data
+            session_id (str, optional): Server-side session key, as in process_message()
+            
+        Yields:
+            Dict[str, Any]: Response deltas followed by the final response
+        """
+        if session_id is not None and session_data is None:
+            session_data = await self.session_store.get(session_id)
+        
+        lowered = message.lower()
+        if (not session_data
+                or session_data.get('conversation_stage') != 'search_results'
+                or lowered in _NEW_SEARCH_COMMANDS
+                or lowered in _TICKET_REQUEST_COMMANDS
+                or self._is_direct_search_command(message)):
+            result = await self.process_message(message, session_data, session_id)
+            yield {**result, 'done': True}
+            return
+        
+        ConversationHistory.attach(session_data).append('user', message, self._get_timestamp())
+        
+        parts = []
+        async for delta in self.azure_openai.stream_response(message, _FOLLOW_UP_CONTEXT):
+            parts.append(delta)
+            yield {'response_delta': delta}
+        
+        # Add ticket creation option to response
+        parts.append(_TICKET_OPTION_SUFFIX)
+        yield {'response_delta': _TICKET_OPTION_SUFFIX}
+        
+        if session_id is not None:
+            await self.session_store.set(session_id, session_data)
+        
+        yield {
+            'response': ''.join(parts),
+            'message_type': 'follow_up',
+            'next_action': 'continue_conversation',
+            'session_data': session_data,
+            'ai_provider': 'azure_openai',
+            'done': True
+        }
     
-    def _handle_greeting(self, message: str, session_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_greeting(self, message: str, session_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle greeting stage"""
         try:
-            # Use Azure OpenAI for intent detection
-            intent_result = self.azure_openai.detect_intent(message, session_data['conversation_history'])
+            # Obvious phrasings are classified locally; everything else goes
+            # to Azure intent detection
+            history = ConversationHistory.attach(session_data)
+            intent_result = self._fast_intent(message)
+            if intent_result is None:
+                intent_result = await self._detect_intent(message, history.recent(3))
             
-            session_data['intent'] = intent_result['intent']
-            session_data['confidence'] = intent_result['confidence']
-            session_data['rationale'] = intent_result['rationale']
+            session_data['intent'] = intent_result.intent
+            session_data['confidence'] = intent_result.confidence
+            session_data['rationale'] = intent_result.rationale
             
             # Add AI response to conversation history
-            session_data['conversation_history'].append({
-                'role': 'assistant',
-                'content': f"I understand you're looking for help with: {intent_result['intent']}",
-                'timestamp': self._get_timestamp()
-            })
+            history.append(
+                'assistant',
+                f"I understand you're looking for help with: {intent_result.intent}",
+                self._get_timestamp()
+            )
             
-            if intent_result['confidence'] >= 0.7:
+            if intent_result.confidence >= 0.7:
                 # High confidence - proceed to data collection
                 session_data['conversation_stage'] = 'data_collection'
                 next_question = self.conversation_manager.get_next_question(session_data)
                 
                 return {
-                    'response': f"Great! I can help you with {intent_result['intent']}. {next_question}",
+                    'response': f"Great! I can help you with {intent_result.intent}. {next_question}",
                     'message_type': 'intent_confirmed',
                     'next_action': 'data_collection',
                     'session_data': session_data,
@@ -228,7 +425,7 @@ class HybridChatbotService:
                 # Low confidence - ask for clarification
                 session_data['conversation_stage'] = 'intent_detection'
                 return {
-                    'response': f"I think you might be looking for help with {intent_result['intent']}, but I'm not completely sure. Could you tell me more about what you need help with?",
+                    'response': f"I think you might be looking for help with {intent_result.intent}, but I'm not completely sure. Could you tell me more about what you need help with?",
                     'message_type': 'intent_clarification',
                     'next_action': 'clarify_intent',
                     'session_data': session_data,
@@ -244,23 +441,25 @@ class HybridChatbotService:
                 'ai_provider': 'azure_openai'
             }
     
-    def _handle_intent_detection(self, message: str, session_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_intent_detection(self, message: str, session_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle intent detection stage"""
         try:
-            # Use Azure OpenAI for intent detection
-            intent_result = self.azure_openai.detect_intent(message, session_data['conversation_history'])
+            # Use Azure OpenAI for intent detection unless a rule fires
+            history = ConversationHistory.attach(session_data)
+            intent_result = (self._fast_intent(message)
+                             or await self._detect_intent(message, history.recent(3)))
             
-            session_data['intent'] = intent_result['intent']
-            session_data['confidence'] = intent_result['confidence']
-            session_data['rationale'] = intent_result['rationale']
+            session_data['intent'] = intent_result.intent
+            session_data['confidence'] = intent_result.confidence
+            session_data['rationale'] = intent_result.rationale
             
-            if intent_result['confidence'] >= 0.6:
+            if intent_result.confidence >= 0.6:
                 # Proceed to data collection
                 session_data['conversation_stage'] = 'data_collection'
                 next_question = self.conversation_manager.get_next_question(session_data)
                 
                 return {
-                    'response': f"Perfect! I understand you need help with {intent_result['intent']}. {next_question}",
+                    'response': f"Perfect! I understand you need help with {intent_result.intent}. {next_question}",
                     'message_type': 'intent_confirmed',
                     'next_action': 'data_collection',
                     'session_data': session_data,
@@ -284,7 +483,7 @@ class HybridChatbotService:
                 'ai_provider': 'azure_openai'
             }
     
-    def _handle_data_collection(self, message: str, session_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_data_collection(self, message: str, session_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle data collection stage"""
         try:
             # Get next question
@@ -293,11 +492,14 @@ class HybridChatbotService:
             if next_question:
                 # Still collecting data
                 field_name = self._extract_field_from_question(next_question, session_data['intent'])
+                changed = False
                 if field_name:
-                    session_data = self.conversation_manager.update_session_data(session_data, field_name, message)
+                    session_data, changed = self.conversation_manager.update_session_data(session_data, field_name, message)
                 
-                # Get next question
-                next_question = self.conversation_manager.get_next_question(session_data)
+                # Get next question, unless nothing was recorded and the
+                # current one still applies
+                if changed:
+                    next_question = self.conversation_manager.get_next_question(session_data)
                 
                 if next_question:
                     return {
@@ -309,7 +511,7 @@ class HybridChatbotService:
                     }
             
             # All data collected - ALWAYS start with Search Agent first
-            return self._handle_search_phase(session_data)
+            return await self._handle_search_phase(session_data)
             
         except Exception as e:
             return {
@@ -320,7 +522,7 @@ class HybridChatbotService:
                 'ai_provider': 'azure_openai'
             }
     
-    def _handle_search_phase(self, session_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_search_phase(self, session_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle search phase using OCI Agents"""
         try:
             # Build search query
@@ -328,28 +530,23 @@ class HybridChatbotService:
             
             # Use real OCI Search Agent if available
             if self.search_agent:
-                search_results = self.search_agent.search(search_query)
+                search_results, formatted_results = await self._cached_search(search_query, session_data['intent'])
                 ai_provider = 'oci_search_agent'
             else:
                 # Fallback to enhanced search service
                 search_results = self.search_service.search_all(search_query, session_data['intent'])
+                formatted_results = self._format_search_results(search_results, session_data['intent'])
                 ai_provider = 'enhanced_search'
             
-            # Format results
-            formatted_results = self._format_search_results(search_results, session_data['intent'])
-            
             # Generate data summary
             data_summary = self.conversation_manager.get_data_summary(session_data)
             
-            # Add ticket creation option to search results
-            ticket_option = "\n\n**If these results don't help solve your issue, you can type 'create ticket' to submit a formal request.**"
-            
             # Update session
             session_data['conversation_stage'] = 'search_results'
             session_data['search_results'] = search_results
             
             return {
-                'response': f"{data_summary}\n\n{formatted_results}{ticket_option}",
+                'response': ''.join((data_summary, '\n\n', formatted_results, _TICKET_OPTION_SUFFIX)),
                 'message_type': 'search_results',
                 'next_action': 'present_results',
                 'session_data': session_data,
@@ -383,7 +580,7 @@ class HybridChatbotService:
                     'ai_provider': 'fallback'
                 }
     
-    def _handle_direct_search(self, message: str, session_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_direct_search(self, message: str, session_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle direct search commands"""
         try:
             # Extract search query from message
@@ -391,16 +588,14 @@ class HybridChatbotService:
             
             # Use real OCI Search Agent if available
             if self.search_agent:
-                search_results = self.search_agent.search(search_query)
+                search_results, formatted_results = await self._cached_search(search_query, "Knowledge")
                 ai_provider = 'oci_search_agent'
             else:
                 # Fallback to enhanced search service
                 search_results = self.search_service.search_all(search_query, "Knowledge")
+                formatted_results = self._format_search_results(search_results, "Knowledge")
                 ai_provider = 'enhanced_search'
             
-            # Format results
-            formatted_results = self._format_search_results(search_results, "Knowledge")
-            
             # Update session data
             session_data['conversation_stage'] = 'search_results'
             session_data['search_results'] = search_results
@@ -424,18 +619,11 @@ class HybridChatbotService:
                 'ai_provider': 'fallback'
             }
     
-    def _handle_search_results(self, message: str, session_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_search_results(self, message: str, session_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle search results stage"""
-        if message.lower() in ['new search', 'search again', 'new query']:
+        if message.lower() in _NEW_SEARCH_COMMANDS:
             # Reset session
-            session_data = {
-                'intent': None,
-                'confidence': 0.0,
-                'rationale': '',
-                'collected_data': {},
-                'conversation_stage': 'intent_detection',
-                'conversation_history': session_data['conversation_history']
-            }
+            self._reset_session(session_data)
             
             return {
                 'response': "Sure! What would you like to search for or what can I help you with?",
@@ -444,7 +632,7 @@ class HybridChatbotService:
                 'session_data': session_data,
                 'ai_provider': 'azure_openai'
             }
-        elif message.lower() in ['create ticket', 'submit ticket', 'log ticket', 'still need help', 'not helpful', 'didn\'t help']:
+        elif message.lower() in _TICKET_REQUEST_COMMANDS:
             # User wants to proceed to ticket creation
             if self._is_ticket_creation_intent(session_data['intent']):
                 return self._handle_ticket_creation_phase(session_data)
@@ -459,14 +647,11 @@ class HybridChatbotService:
         else:
             # Use Azure OpenAI to generate a helpful response
             try:
-                context = "You are a helpful IT support assistant. The user has just received search results and is asking a follow-up question. If the search results don't help, suggest they can create a ticket."
-                response = self.azure_openai.generate_response(message, context)
+                response = await self.azure_openai.generate_response(message, _FOLLOW_UP_CONTEXT)
                 
                 # Add ticket creation option to response
-                response += "\n\n**If these results don't help solve your issue, you can type 'create ticket' to submit a formal request.**"
-                
                 return {
-                    'response': response,
+                    'response': ''.join((response, _TICKET_OPTION_SUFFIX)),
                     'message_type': 'follow_up',
                     'next_action': 'continue_conversation',
                     'session_data': session_data,
@@ -474,7 +659,7 @@ class HybridChatbotService:
                 }
             except Exception as e:
                 return {
-                    'response': "I'm here to help! Is there anything specific about the search results you'd like to know more about?\n\n**If these results don't help solve your issue, you can type 'create ticket' to submit a formal request.**",
+                    'response': _FOLLOW_UP_FALLBACK,
                     'message_type': 'follow_up',
                     'next_action': 'continue_conversation',
                     'session_data': session_data,
@@ -483,46 +668,100 @@ class HybridChatbotService:
     
     def _handle_unknown_stage(self, message: str, session_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle unknown conversation stage"""
+        # Don't let a cached classification steer the restarted conversation
+        self.intent_cache.invalidate(message, ConversationHistory.attach(session_data).recent(3))
+        
         return {
             'response': "I'm not sure what to do next. Let me start over and help you with your request.",
             'message_type': 'reset',
             'next_action': 'detect_intent',
-            'session_data': {
-                'intent': None,
-                'confidence': 0.0,
-                'rationale': '',
-                'collected_data': {},
-                'conversation_stage': 'intent_detection',
-                'conversation_history': session_data['conversation_history']
-            },
+            'session_data': self._reset_session(session_data),
             'ai_provider': 'azure_openai'
         }
     
+    def _reset_session(self, session_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reset session state in place, keeping only the conversation history.
+        
+        Everything else (collected data, search results)
+        is dropped so it is not carried into the restarted conversation.
+        """
+        history = session_data.get('conversation_history') or ConversationHistory.empty_columns()
+        session_data.clear()
+        session_data.update({
+            'intent': None,
+            'confidence': 0.0,
+            'rationale': '',
+            'collected_data': {},
+            'conversation_stage': 'intent_detection',
+            'conversation_history': history
+        })
+        return session_data
+    
+    async def _search(self, query: str) -> str:
+        """Run an OCI search in a worker thread, bounded across sessions; raises on failure"""
+        async with self._oci_sema:
+            return await self.search_agent.async_search(query)
+    
+    async def _cached_search(self, query: str, intent: str) -> Tuple[Any, str]:
+        """Search and format results, serving repeated queries from the LRU cache"""
+        cached = self.search_cache.get(query, intent)
+        if cached is not None:
+            return cached
+        
+        try:
+            search_results = await self._search(query)
+        except Exception as e:
+            # Report the failure to the user but don't cache it, so a retry
+            # searches again
+            search_results = _SEARCH_FAILED.format(e)
+            return search_results, self._format_search_results(search_results, intent)
+        
+        entry = (search_results, self._format_search_results(search_results, intent))
+        self.search_cache.put(query, intent, entry)
+        return entry
+    
+    async def _detect_intent(self, message: str, conversation_history: List[Tuple[str, str]]) -> IntentResult:
+        """Detect intent via Azure, serving repeated messages from the LRU cache"""
+        # Without Azure the keyword fallback answers immediately; skip the
+        # cache hashing and the batcher's collection window
+        if not self.azure_openai.use_azure:
+            return detect_keyword_intent(message)
+        
+        cached = self.intent_cache.get(message, conversation_history)
+        if cached is not None:
+            return cached
+        
+        intent_result = await self.intent_batcher.submit(message, conversation_history)
+        # A keyword fallback means Azure failed; retry it next time
+        if not is_keyword_result(intent_result):
+            self.intent_cache.put(message, conversation_history, intent_result)
+        return intent_result
+    
+    def _fast_intent(self, message: str) -> Optional[IntentResult]:
+        """
+        Classify obvious messages with a single precompiled regex scan.
+        
+        Returns an IntentResult when exactly one intent's phrases match,
+        otherwise None so the caller falls back to Azure.
+        """
+        matched = {m.lastgroup for m in _FAST_INTENT_RE.finditer(message)}
+        if len(matched) != 1:
+            return None
+        
+        intent = matched.pop()
+        return IntentResult(intent, _FAST_INTENT_CONFIDENCE[intent], 'Matched known phrase for this intent')
+    
     def _is_direct_search_command(self, message: str) -> bool:
         """Check if message is a direct search command"""
-        search_commands = ['search for', 'find', 'look for', 'show me']
-        return any(cmd in message.lower() for cmd in search_commands)
+        return bool(_SEARCH_CMD_RE.search(message))
     
     def _extract_field_from_question(self, question: str, intent: str) -> Optional[str]:
         """Extract field name from question"""
         # This is a simplified implementation
         # In a real system, you'd have more sophisticated field extraction
-        field_mapping = {
-            'short_description': ['brief description', 'what is the issue'],
-            'detailed_description': ['more details', 'what\'s happening'],
-            'impact_scope': ['who is affected', 'impact scope'],
-            'urgency': ['how urgent', 'urgency level'],
-            'affected_service': ['what service', 'affected system'],
-            'start_time': ['when did this', 'start time'],
-            'frequency': ['how often', 'frequency']
-        }
-        
-        question_lower = question.lower()
-        for field, keywords in field_mapping.items():
-            if any(keyword in question_lower for keyword in keywords):
-                return field
-        
-        return None
+        match = _FIELD_KEYWORD_RE.search(question.lower())
+        return _FIELD_KEYWORDS[match.group(0)] if match else None
     
     def _format_search_results(self, search_results: Any, intent: str) -> str:
         """Format search results for display"""
@@ -535,29 +774,33 @@ class HybridChatbotService:
             return f"## Search Results\n\n{search_results}"
         
         if isinstance(search_results, dict):
-            formatted = "## Search Results\n\n"
+            parts = ["## Search Results\n\n"]
             
             # Format ticket results
             if 'tickets' in search_results and search_results['tickets']:
-                formatted += "### Related Tickets\n"
+                parts.append("### Related Tickets\n")
                 for ticket in search_results['tickets'][:3]:  # Show top 3
-                    formatted += f"- **{ticket.get('number', 'N/A')}**: {ticket.get('short_description', 'No description')}\n"
-                    if ticket.get('url'):
-                        formatted += f"  [View Ticket]({ticket['url']})\n"
-                    formatted += "\n"
+                    number = ticket.get('number', 'N/A')
+                    description = ticket.get('short_description', 'No description')
+                    url = ticket.get('url')
+                    link = f"  [View Ticket]({url})\n" if url else ""
+                    parts.append(f"- **{number}**: {description}\n{link}\n")
             
             # Format knowledge results
             if 'knowledge' in search_results and search_results['knowledge']:
-                formatted += "### Knowledge Articles\n"
+                parts.append("### Knowledge Articles\n")
                 for article in search_results['knowledge'][:3]:  # Show top 3
-                    formatted += f"- **{article.get('title', 'No title')}**: {article.get('summary', 'No summary')}\n"
-                    if article.get('url'):
-                        formatted += f"  [Read Article]({article['url']})\n"
-                    formatted += "\n"
+                    title = article.get('title', 'No title')
+                    summary = article.get('summary', 'No summary')
+                    url = article.get('url')
+                    link = f"  [Read Article]({url})\n" if url else ""
+                    parts.append(f"- **{title}**: {summary}\n{link}\n")
+            
+            formatted = ''.join(parts)
             
             # If no specific format, show the raw results
             if not formatted.strip().endswith("## Search Results"):
-                formatted += f"### Raw Results\n{str(search_results)[:500]}...\n"
+                formatted = f"{formatted}### Raw Results\n{str(search_results)[:500]}...\n"
             
             return formatted
         
@@ -565,17 +808,31 @@ class HybridChatbotService:
         return f"## Search Results\n\n{str(search_results)[:500]}..."
     
     def _get_timestamp(self) -> str:
-        """Get current timestamp"""
-        from datetime import datetime
-        return datetime.now().isoformat()
+        """Get current UTC timestamp in ISO 8601 format"""
+        return datetime.now(timezone.utc).isoformat(timespec='milliseconds')
     
     def _is_ticket_creation_intent(self, intent: str) -> bool:
         """Check if the intent is for ticket creation"""
-        ticket_creation_intents = [
-            'create_incident', 'create_request', 'create_change', 'create_problem',
-            'submit_ticket', 'log_issue', 'create_ticket', 'report_issue'
-        ]
-        return intent.lower() in ticket_creation_intents
+        return intent.lower() in _TICKET_INTENTS
+    
+    @staticmethod
+    def _intent_data(session_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the intent payload the ticket creation agent expects"""
+        get = session_data.get
+        return {
+            'intent': session_data['intent'],
+            'confidence': get('confidence', 0.0),
+            'rationale': get('rationale', '')
+        }
+    
+    @staticmethod
+    def _user_context(session_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the user/session context passed to the ticket creation agent"""
+        get = session_data.get
+        return {
+            'user_id': get('user_id', 'unknown'),
+            'session_id': get('session_id', 'unknown')
+        }
     
     def _handle_ticket_creation_phase(self, session_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle ticket creation phase using Ticket Creation Agent"""
@@ -589,19 +846,10 @@ class HybridChatbotService:
                     'ai_provider': 'ticket_creation_agent'
                 }
             
-            # Prepare intent data
-            intent_data = {
-                'intent': session_data['intent'],
-                'confidence': session_data.get('confidence', 0.0),
-                'rationale': session_data.get('rationale', '')
-            }
-            
-            # Prepare user context
-            user_context = {
-                'user_id': session_data.get('user_id', 'unknown'),
-                'session_id': session_data.get('session_id', 'unknown'),
-                'timestamp': self._get_timestamp()
-            }
+            # Prepare intent data and user context
+            intent_data = self._intent_data(session_data)
+            user_context = self._user_context(session_data)
+            user_context['timestamp'] = self._get_timestamp()
             
             # Call ticket creation agent
             result = self.ticket_creation_agent.create_ticket(
@@ -643,24 +891,13 @@ class HybridChatbotService:
                     'session_data': session_data
                 }
             
-            # Get duplicate data from session
-            duplicate_data = session_data.get('duplicate_data', {})
-            intent_data = {
-                'intent': session_data['intent'],
-                'confidence': session_data.get('confidence', 0.0),
-                'rationale': session_data.get('rationale', '')
-            }
-            
             # Handle the decision
             result = self.ticket_creation_agent.handle_duplicate_decision(
                 decision,
-                duplicate_data,
-                intent_data,
+                session_data.get('duplicate_data', {}),
+                self._intent_data(session_data),
                 session_data['collected_data'],
-                {
-                    'user_id': session_data.get('user_id', 'unknown'),
-                    'session_id': session_data.get('session_id', 'unknown')
-                }
+                self._user_context(session_data)
             )
             
             # Update session data
@@ -0,0 +1,118 @@
+"""
+Intent Detection Batcher - Coalesces concurrent classification requests
+
+Buffers intent-detection calls arriving from concurrent chat sessions and
+sends them to Azure OpenAI as a single chat completion. A batch is flushed
+when it reaches ``max_batch`` messages or when ``wait_ms`` has elapsed since
+its first message, whichever comes first.
+"""
+
+# Standard library imports
+import asyncio
+from typing import List, Optional, Set, Tuple
+
+# Local imports
+from config.config import Config
+from services.intent_result import IntentResult
+
+
+class BatchingIntentDetector:
+    """
+    Micro-batching front end for ``AsyncAzureOpenAIService`` intent detection.
+
+    Callers ``await submit(message, history)`` and receive the same
+    ``IntentResult`` that ``detect_intent`` would return. A background task
+    drains the queue, groups pending requests and starts one batched
+    completion per group without waiting for earlier groups to finish.
+    Single-message batches use the regular per-message prompt so an idle
+    service behaves exactly as before.
+
+    Attributes:
+        service: Async Azure OpenAI service providing detect_intent() and
+            detect_intents_batch()
+        max_batch (int): Maximum number of messages per completion
+        wait_ms (int): Maximum time to hold a batch open for more messages
+    """
+
+    def __init__(self, service, max_batch: int = None, wait_ms: int = None):
+        self.service = service
+        self.max_batch = max_batch or Config.INTENT_BATCH_MAX_SIZE
+        self.wait_ms = wait_ms if wait_ms is not None else Config.INTENT_BATCH_WAIT_MS
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Dispatches in flight; held so the tasks are not garbage collected
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def submit(self, message: str, conversation_history: List[Tuple[str, str]] = None) -> IntentResult:
+        """
+        Queue a message for classification and wait for its result
+
+        Args:
+            message (str): User's message
+            conversation_history (list): Previous (role, content) turns
+
+        Returns:
+            IntentResult with intent, confidence, and rationale
+        """
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((message, conversation_history, future))
+        return await future
+
+    async def close(self):
+        """Stop the background worker; dispatches already started finish"""
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+        self._queue = None
+
+    def _ensure_worker(self):
+        """Start the drain task on the running event loop if needed"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def _run(self):
+        """Collect queued requests into batches and dispatch them"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.wait_ms / 1000
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Go straight back to collecting while this completion runs
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch):
+        """Run one completion for the batch and resolve every caller"""
+        try:
+            if len(batch) == 1:
+                message, history, _ = batch[0]
+                results = [await self.service.detect_intent(message, history)]
+            else:
+                results = await self.service.detect_intents_batch(
+                    [(message, history) for message, history, _ in batch]
+                )
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,76 @@
+"""
+Intent Detection Cache - LRU memoization of intent classification results
+
+Repeated messages (client retries, error branches that loop back, test
+suites) would otherwise trigger a fresh Azure OpenAI or OCI call each time.
+Results are keyed by the normalized message (lowercased, whitespace
+collapsed) and the last assistant turn, which is the part of the history
+that changes how a message should be read.
+"""
+
+# Standard library imports
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import List, Optional, Tuple
+
+# Local imports
+from services.intent_result import IntentResult
+
+
+class IntentCache:
+    """
+    Thread-safe LRU cache for intent detection results.
+
+    Attributes:
+        maxsize (int): Maximum number of cached classifications
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, IntentResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(message: str, conversation_history: List[Tuple[str, str]] = None) -> str:
+        """Build the cache key from the message and last assistant turn"""
+        normalized = " ".join(message.lower().split())
+        key = blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+        last_assistant = ""
+        for role, content in reversed(conversation_history or []):
+            if role == 'assistant':
+                last_assistant = content
+                break
+
+        return key + blake2b(last_assistant.encode(), digest_size=8).hexdigest()
+
+    def get(self, message: str, conversation_history: List[Tuple[str, str]] = None) -> Optional[IntentResult]:
+        """Return the cached result, or None on a miss"""
+        key = self.make_key(message, conversation_history)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, message: str, conversation_history: List[Tuple[str, str]], result: IntentResult):
+        """Store a classification result, evicting the least recently used"""
+        key = self.make_key(message, conversation_history)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, message: str, conversation_history: List[Tuple[str, str]] = None):
+        """Drop the cached result for a message, if any"""
+        key = self.make_key(message, conversation_history)
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all cached results"""
+        with self._lock:
+            self._entries.clear()
@@ -1,11 +1,88 @@
 """
 Intent Detection Service using OCI Generative AI
 """
+import asyncio
+import atexit
+import functools
 import json
-from typing import Dict, Any, Optional
-from oci.generative_ai_inference import GenerativeAiInferenceClient
-from oci.generative_ai_inference.models import GenerateTextDetails
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from config.config import Config
+from config.logging_config import get_logger
+from services.intent_batch import BATCH_RESPONSE_FORMAT, format_batch_messages, match_batch_response
+from services.intent_result import IntentResult
+from services.keyword_intent import detect_keyword_intent, is_keyword_result
+from services.intent_cache import IntentCache
+from services.stream_json import JSONObjectStream
+
+# Initialize logger
+logger = get_logger("intent_detection")
+
+# Streamed generations arrive as one small JSON event per token
+_loads = orjson.loads if orjson is not None else json.loads
+
+_INTENT_CATEGORIES = """1. Incident - Something is broken or not working
+2. Request - Requesting a new service, access, or resource
+3. Change - Requesting to modify existing systems or processes
+4. Problem - Recurring issues or root cause analysis
+5. Status - Checking status of existing tickets
+6. Knowledge - Looking for information or documentation
+7. Other - General questions or unclear intent"""
+
+# Static prompt text is built once; each call only concatenates the
+# conversation context and the user's message between head and tail
+_INTENT_PROMPT_HEAD = """
+You are an IT support intent classifier. Analyze the user's message and classify it into one of these categories:
+
+""" + _INTENT_CATEGORIES + """
+
+"""
+
+_INTENT_PROMPT_TAIL = """
+
+Respond with a JSON object containing:
+- intent: one of the categories above
+- confidence: number between 0.0 and 1.0
+- rationale: brief explanation of why this intent was chosen
+
+Examples:
+- "My laptop won't start" → {"intent": "Incident", "confidence": 0.9, "rationale": "Hardware failure requiring immediate attention"}
+- "I need access to the database" → {"intent": "Request", "confidence": 0.8, "rationale": "Requesting new access permissions"}
+- "Can you help me understand how to reset passwords?" → {"intent": "Knowledge", "confidence": 0.7, "rationale": "Seeking procedural information"}
+
+JSON response:"""
+
+_BATCH_INTENT_PROMPT_HEAD = """
+You are an IT support intent classifier. Classify each message, sent by independent users, into one of these categories:
+
+""" + _INTENT_CATEGORIES + """
+
+""" + BATCH_RESPONSE_FORMAT + """
+Messages:
+"""
+
+_BATCH_INTENT_PROMPT_TAIL = """
+
+JSON response:"""
+
+# An OCI answer at or above this confidence always beats the keyword fallback
+_SPECULATIVE_MIN_CONFIDENCE = 0.7
+
+
+def _log_late_failure(task: asyncio.Future):
+    """Retrieve a speculative OCI call's outcome, which may arrive after nobody awaits it"""
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Speculative OCI intent detection failed: %s", task.exception())
+
 
 class IntentDetectionService:
     """Service for detecting user intent using OCI Generative AI"""
@@ -16,6 +93,16 @@ class IntentDetectionService:
             Config.OCI_FINGERPRINT and Config.OCI_PRIVATE_KEY_PATH and 
             Config.OCI_COMPARTMENT_ID):
             try:
+                # The OCI SDK is only loaded when it will be used, so
+                # fallback-only deployments never import it
+                from oci.generative_ai_inference import GenerativeAiInferenceClient
+                from oci.generative_ai_inference.models import (
+                    CohereLlmInferenceRequest, GenerateTextDetails, OnDemandServingMode
+                )
+                self._ReqCls = CohereLlmInferenceRequest
+                self._DetailsCls = GenerateTextDetails
+                self._ModeCls = OnDemandServingMode
+                
                 self.client = GenerativeAiInferenceClient(
                     config={
                         "region": Config.REGION,
@@ -25,35 +112,200 @@ class IntentDetectionService:
                         "key_file": Config.OCI_PRIVATE_KEY_PATH
                     }
                 )
+                self._tune_connection_pool()
                 self.compartment_id = Config.OCI_COMPARTMENT_ID
                 self.model_id = Config.OCI_MODEL_ID or "cohere.command"
                 self.use_oci = True
-                print("✅ OCI Generative AI client initialized")
+                logger.info("✅ OCI Generative AI client initialized")
             except Exception as e:
-                print(f"⚠️ OCI client initialization failed: {e}")
+                logger.warning("⚠️ OCI client initialization failed: %s", e)
                 self.client = None
                 self.use_oci = False
         else:
-            print("⚠️ OCI configuration incomplete, using fallback intent detection")
+            logger.warning("⚠️ OCI configuration incomplete, using fallback intent detection")
             self.client = None
             self.use_oci = False
+        
+        # Repeated messages are answered from an LRU instead of the LLM
+        self.intent_cache = IntentCache(maxsize=512)
+        
+        # Micro-batching of concurrent detect_intent() calls
+        self.batch_max_size = Config.INTENT_BATCH_MAX_SIZE
+        self.batch_wait_ms = Config.INTENT_BATCH_WAIT_MS
+        self.detection_timeout = Config.INTENT_DETECTION_TIMEOUT_SECONDS
+        
+        # Time async callers wait for OCI before taking the keyword result
+        self.speculative_budget_ms = Config.INTENT_SPECULATIVE_BUDGET_MS
+        self._pending = deque()
+        self._pending_ready = threading.Condition()
+        self._flusher = None
+        self._flusher_lock = threading.Lock()
+        # Batches are classified on these workers so OCI calls overlap
+        self._batch_executor = None
+        self._closed = False
     
-    def detect_intent(self, user_message: str, conversation_history: list = None) -> Dict[str, Any]:
+    def _tune_connection_pool(self):
+        """
+        Size the OCI client's keep-alive pool for concurrent classification
+        
+        The SDK sends requests through a ``requests.Session`` whose default
+        adapter keeps only 10 connections per host, so batch flushes and
+        concurrent callers would otherwise open (and TLS-handshake) fresh
+        connections. Mounting a larger non-blocking adapter keeps them warm.
+        """
+        from requests.adapters import HTTPAdapter
+        
+        session = getattr(getattr(self.client, 'base_client', None), 'session', None)
+        if session is None:
+            return
+        adapter = HTTPAdapter(
+            pool_connections=Config.OCI_HTTP_POOL_SIZE,
+            pool_maxsize=Config.OCI_HTTP_POOL_SIZE,
+            pool_block=False
+        )
+        session.mount("https://", adapter)
+    
+    def detect_intent(self, user_message: str, conversation_history: list = None) -> IntentResult:
         """
         Detect user intent from message
         
+        Concurrent callers are coalesced: requests arriving within
+        ``INTENT_BATCH_WAIT_MS`` of each other (up to
+        ``INTENT_BATCH_MAX_SIZE``) are classified with one OCI call. A
+        caller whose batch has not been classified within
+        ``INTENT_DETECTION_TIMEOUT_SECONDS`` gets the keyword result.
+        
         Args:
             user_message (str): User's message
             conversation_history (list): Previous conversation context
             
         Returns:
-            Dict with intent, confidence, and rationale
+            IntentResult with intent, confidence, and rationale
         """
+        # Use fallback if OCI is not available; keyword matching is cheaper
+        # than the cache lookup, so it is not cached
+        if not self.use_oci:
+            return self._fallback_intent_detection(user_message)
+        
+        recent = [(msg.get('role', 'user'), msg.get('content', ''))
+                  for msg in (conversation_history or [])[-3:]]
+        cached = self.intent_cache.get(user_message, recent)
+        if cached is not None:
+            return cached
+        
+        self._ensure_flusher()
+        future = Future()
+        with self._pending_ready:
+            if self._closed:
+                return self._fallback_intent_detection(user_message)
+            self._pending.append((user_message, conversation_history, future))
+            self._pending_ready.notify()
+        try:
+            result = future.result(timeout=self.detection_timeout)
+        except FutureTimeoutError:
+            logger.warning("Intent detection timed out after %ss, using keyword fallback", self.detection_timeout)
+            return self._fallback_intent_detection(user_message)
+        
+        # A keyword fallback means the OCI call failed; retry it next time
+        if not is_keyword_result(result):
+            self.intent_cache.put(user_message, recent, result)
+        return result
+    
+    async def async_detect_intent(self, user_message: str, conversation_history: list = None) -> IntentResult:
+        """
+        Detect user intent without blocking the event loop
+        
+        The OCI SDK client is synchronous, so the call runs in a worker
+        thread; concurrent awaits still coalesce into batched OCI calls.
+        
+        With a non-zero ``INTENT_SPECULATIVE_BUDGET_MS`` (opt-in), the
+        keyword fallback is computed alongside. If OCI has not answered
+        within the budget, or answers with lower
+        confidence than both the threshold and the fallback, the fallback
+        is returned. A late OCI call keeps running in its thread and still
+        fills the intent cache for the next time the message is seen.
+        
+        Args:
+            user_message (str): User's message
+            conversation_history (list): Previous conversation context
+            
+        Returns:
+            IntentResult with intent, confidence, and rationale
+        """
+        if not self.use_oci or self.speculative_budget_ms <= 0:
+            return await asyncio.to_thread(self.detect_intent, user_message, conversation_history)
+        
+        oci_task = asyncio.ensure_future(
+            asyncio.to_thread(self.detect_intent, user_message, conversation_history)
+        )
+        oci_task.add_done_callback(_log_late_failure)
+        fallback = self._fallback_intent_detection(user_message)
+        
+        done, _ = await asyncio.wait({oci_task}, timeout=self.speculative_budget_ms / 1000)
+        if done:
+            result = oci_task.result()
+            if (result.confidence >= _SPECULATIVE_MIN_CONFIDENCE
+                    or result.confidence >= fallback.confidence):
+                return result
+        return fallback
+    
+    async def detect_intents_many(self, messages: List[str]) -> List[IntentResult]:
+        """
+        Classify independent messages concurrently
+        
+        Args:
+            messages (list): User messages
+            
+        Returns:
+            List of IntentResults in the same order as ``messages``
+        """
+        return list(await asyncio.gather(*(self.async_detect_intent(m) for m in messages)))
+    
+    def detect_intents_batch(self, items: List[Tuple[str, Optional[list]]]) -> List[IntentResult]:
+        """
+        Classify several user messages with a single OCI generate_text call
+        
+        Args:
+            items (list): (user_message, conversation_history) pairs
+            
+        Returns:
+            List of IntentResults in the same order as ``items``
+        """
+        messages = [message for message, _ in items]
         try:
-            # Use fallback if OCI is not available
             if not self.use_oci:
-                return self._fallback_intent_detection(user_message)
+                return [self._fallback_intent_detection(m) for m in messages]
+            
+            entries = format_batch_messages([
+                (user_message, [(msg.get('role', 'user'), msg.get('content', ''))
+                                for msg in conversation_history or []])
+                for user_message, conversation_history in items
+            ])
+            prompt = _BATCH_INTENT_PROMPT_HEAD + entries + _BATCH_INTENT_PROMPT_TAIL
+            response_text = self._generate_text(prompt, max_tokens=120 * len(items))
             
+            # Results are matched to the messages by id; a response that
+            # does not classify each message exactly once is discarded
+            matched = match_batch_response(response_text, len(messages))
+            if matched is None:
+                logger.warning("Batch intent detection response did not classify each message exactly once")
+                return [self._fallback_intent_detection(m) for m in messages]
+            
+            results = []
+            for user_message, item in zip(messages, matched):
+                try:
+                    results.append(IntentResult.from_llm(item))
+                except (TypeError, KeyError, ValueError):
+                    results.append(self._fallback_intent_detection(user_message))
+            return results
+            
+        except Exception as e:
+            logger.warning("Error in batch intent detection: %s", e)
+            return [self._fallback_intent_detection(m) for m in messages]
+    
+    def _detect_intent_single(self, user_message: str, conversation_history: list = None) -> IntentResult:
+        """Classify one message with its own OCI generate_text call"""
+        try:
             # Build context from conversation history
             context = ""
             if conversation_history:
@@ -61,106 +313,177 @@ class IntentDetectionService:
                 for msg in conversation_history[-3:]:  # Last 3 messages for context
                     context += f"{msg.get('role', 'user')}: {msg.get('content', '')}\n"
             
-            prompt = f"""
-You are an IT support intent classifier. Analyze the user's message and classify it into one of these categories:
-
-1. Incident - Something is broken or not working
-2. Request - Requesting a new service, access, or resource
-3. Change - Requesting to modify existing systems or processes
-4. Problem - Recurring issues or root cause analysis
-5. Status - Checking status of existing tickets
-6. Knowledge - Looking for information or documentation
-7. Other - General questions or unclear intent
-
-{context}
-
-User message: "{user_message}"
-
-Respond with a JSON object containing:
-- intent: one of the categories above
-- confidence: number between 0.0 and 1.0
-- rationale: brief explanation of why this intent was chosen
-
-Examples:
-- "My laptop won't start" → {{"intent": "Incident", "confidence": 0.9, "rationale": "Hardware failure requiring immediate attention"}}
-- "I need access to the database" → {{"intent": "Request", "confidence": 0.8, "rationale": "Requesting new access permissions"}}
-- "Can you help me understand how to reset passwords?" → {{"intent": "Knowledge", "confidence": 0.7, "rationale": "Seeking procedural information"}}
-
-JSON response:"""
-
-            # Call OCI Generative AI
-            from oci.generative_ai_inference.models import CohereLlmInferenceRequest, OnDemandServingMode
-            
-            inference_request = CohereLlmInferenceRequest(
-                prompt=prompt,
-                max_tokens=200,
-                temperature=0.1
-            )
-            
-            generate_text_details = GenerateTextDetails(
-                compartment_id=self.compartment_id,
-                serving_mode=OnDemandServingMode(model_id=self.model_id),
-                inference_request=inference_request
-            )
+            prompt = _INTENT_PROMPT_HEAD + context + f'\n\nUser message: "{user_message}"' + _INTENT_PROMPT_TAIL
             
-            response = self.client.generate_text(generate_text_details)
-            
-            # Parse the response
-            response_text = response.data.choices[0].message.content.strip()
+            # Parse the JSON object as it streams in and stop generating as
+            # soon as it closes, instead of waiting for the full completion
+            parser = JSONObjectStream()
+            chunks = self._stream_text(prompt, max_tokens=200)
+            try:
+                for chunk in chunks:
+                    if parser.feed(chunk):
+                        break
+            finally:
+                chunks.close()
             
-            # Extract JSON from response
+            result = parser.value
             try:
-                # Find JSON in the response
-                start_idx = response_text.find('{')
-                end_idx = response_text.rfind('}') + 1
-                if start_idx != -1 and end_idx != -1:
-                    json_str = response_text[start_idx:end_idx]
-                    result = json.loads(json_str)
-                    
-                    # Validate the result
-                    if all(key in result for key in ['intent', 'confidence', 'rationale']):
-                        return {
-                            'intent': result['intent'],
-                            'confidence': float(result['confidence']),
-                            'rationale': result['rationale']
-                        }
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                print(f"Error parsing intent detection response: {e}")
+                # Validate the result
+                if result and all(key in result for key in ['intent', 'confidence', 'rationale']):
+                    return IntentResult.from_llm(result)
+            except (TypeError, ValueError) as e:
+                logger.warning("Error parsing intent detection response: %s", e)
             
             # Fallback to simple keyword-based detection
             return self._fallback_intent_detection(user_message)
             
         except Exception as e:
-            print(f"Error in intent detection: {e}")
+            logger.warning("Error in intent detection: %s", e)
             return self._fallback_intent_detection(user_message)
     
-    def _fallback_intent_detection(self, user_message: str) -> Dict[str, Any]:
+    def _generate_text(self, prompt: str, max_tokens: int) -> str:
+        """Run one Cohere completion on OCI Generative AI"""
+        inference_request = self._ReqCls(
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=0.1
+        )
+        
+        generate_text_details = self._DetailsCls(
+            compartment_id=self.compartment_id,
+            serving_mode=self._ModeCls(model_id=self.model_id),
+            inference_request=inference_request
+        )
+        
+        response = self.client.generate_text(generate_text_details)
+        return response.data.choices[0].message.content.strip()
+    
+    def _stream_text(self, prompt: str, max_tokens: int):
+        """
+        Stream one Cohere completion on OCI Generative AI
+        
+        Yields text fragments as the model emits them. Closing the generator
+        early closes the server-sent event stream, which ends the generation.
+        """
+        inference_request = self._ReqCls(
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=0.1,
+            is_stream=True
+        )
+        
+        generate_text_details = self._DetailsCls(
+            compartment_id=self.compartment_id,
+            serving_mode=self._ModeCls(model_id=self.model_id),
+            inference_request=inference_request
+        )
+        
+        stream = self.client.generate_text(generate_text_details).data
+        try:
+            for event in stream.events():
+                text = _loads(event.data).get('text')
+                if text:
+                    yield text
+        finally:
+            close = getattr(stream, 'close', None)
+            if close:
+                close()
+    
+    def _ensure_flusher(self):
+        """Start the background batch flusher thread if needed"""
+        with self._flusher_lock:
+            if self._closed:
+                return
+            if self._batch_executor is None:
+                self._batch_executor = ThreadPoolExecutor(
+                    max_workers=Config.OCI_HTTP_POOL_SIZE,
+                    thread_name_prefix="intent-batch"
+                )
+                atexit.register(self.close)
+            if self._flusher is None or not self._flusher.is_alive():
+                self._flusher = threading.Thread(target=self._flush_loop, name="intent-batch-flusher", daemon=True)
+                self._flusher.start()
+    
+    def _flush_loop(self):
+        """Collect pending requests into batches and hand them to the workers"""
+        while True:
+            with self._pending_ready:
+                while not self._pending and not self._closed:
+                    self._pending_ready.wait()
+                
+                # Hold the batch open briefly so concurrent requests join it
+                deadline = time.monotonic() + self.batch_wait_ms / 1000
+                while len(self._pending) < self.batch_max_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._pending_ready.wait(remaining)
+                
+                if self._closed:
+                    batch = list(self._pending)
+                    self._pending.clear()
+                    self._resolve_with_fallback(batch)
+                    return
+                
+                batch = [self._pending.popleft()
+                         for _ in range(min(self.batch_max_size, len(self._pending)))]
+            
+            try:
+                self._batch_executor.submit(self._classify_batch, batch)
+            except RuntimeError:
+                # The workers were shut down; nothing queued can reach OCI
+                self._resolve_with_fallback(batch)
+                return
+    
+    def _classify_batch(self, batch):
+        """Classify one batch with a single OCI call and resolve its futures"""
+        try:
+            if len(batch) == 1:
+                message, history, _ = batch[0]
+                results = [self._detect_intent_single(message, history)]
+            else:
+                results = self.detect_intents_batch([(message, history) for message, history, _ in batch])
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+        
+        for (_, _, future), result in zip(batch, results):
+            future.set_result(result)
+    
+    def _resolve_with_fallback(self, batch):
+        """Answer requests that will not reach OCI with the keyword result"""
+        for message, _, future in batch:
+            future.set_result(self._fallback_intent_detection(message))
+    
+    def close(self):
+        """
+        Stop the batch flusher and its workers
+        
+        Requests still queued are answered with the keyword result; batches
+        already handed to a worker finish in the background.
+        """
+        with self._pending_ready:
+            self._closed = True
+            self._pending_ready.notify_all()
+        with self._flusher_lock:
+            flusher, executor = self._flusher, self._batch_executor
+        if flusher is not None:
+            flusher.join(timeout=1)
+        if executor is not None:
+            executor.shutdown(wait=False)
+    
+    def _fallback_intent_detection(self, user_message: str) -> IntentResult:
         """Fallback keyword-based intent detection"""
-        message_lower = user_message.lower()
-        
-        # Incident keywords
-        incident_keywords = ['broken', 'not working', 'error', 'failed', 'down', 'issue', 'problem', 'crash', 'hang']
-        if any(keyword in message_lower for keyword in incident_keywords):
-            return {'intent': 'Incident', 'confidence': 0.7, 'rationale': 'Detected incident keywords'}
-        
-        # Request keywords
-        request_keywords = ['need', 'want', 'request', 'access', 'permission', 'account', 'user']
-        if any(keyword in message_lower for keyword in request_keywords):
-            return {'intent': 'Request', 'confidence': 0.6, 'rationale': 'Detected request keywords'}
-        
-        # Change keywords
-        change_keywords = ['change', 'modify', 'update', 'upgrade', 'migrate', 'deploy']
-        if any(keyword in message_lower for keyword in change_keywords):
-            return {'intent': 'Change', 'confidence': 0.6, 'rationale': 'Detected change keywords'}
-        
-        # Status keywords
-        status_keywords = ['status', 'check', 'ticket', 'progress', 'update']
-        if any(keyword in message_lower for keyword in status_keywords):
-            return {'intent': 'Status', 'confidence': 0.7, 'rationale': 'Detected status keywords'}
-        
-        # Knowledge keywords
-        knowledge_keywords = ['how', 'what', 'where', 'when', 'why', 'help', 'guide', 'documentation']
-        if any(keyword in message_lower for keyword in knowledge_keywords):
-            return {'intent': 'Knowledge', 'confidence': 0.6, 'rationale': 'Detected knowledge keywords'}
-        
-        return {'intent': 'Other', 'confidence': 0.3, 'rationale': 'Unable to determine specific intent'}
+        return detect_keyword_intent(user_message)
+
+
+@functools.lru_cache(maxsize=1)
+def get_intent_service() -> IntentDetectionService:
+    """
+    Return the process-wide IntentDetectionService
+    
+    Building the service creates an OCI client (key file parsing, signer
+    setup) and its batching state, so callers share one instance.
+    """
+    return IntentDetectionService()
@@ -0,0 +1,37 @@
+"""
+Intent Result - Record returned by every intent classifier
+
+Classifiers used to build a fresh ``{'intent', 'confidence', 'rationale'}``
+dict per call. A NamedTuple is smaller and cheaper to construct, and being
+immutable it can be cached or precomputed and handed out without copying.
+Call ``_asdict()`` where a dict is needed for JSON.
+"""
+
+# Standard library imports
+from typing import Any, Mapping, NamedTuple
+
+
+class IntentResult(NamedTuple):
+    """
+    Classification of one user message.
+
+    Attributes:
+        intent (str): Intent category, e.g. "Incident"
+        confidence (float): Confidence between 0.0 and 1.0
+        rationale (str): Short explanation of the classification
+    """
+
+    intent: str
+    confidence: float
+    rationale: str
+
+    @classmethod
+    def from_llm(cls, data: Mapping[str, Any]) -> "IntentResult":
+        """
+        Build a result from a parsed LLM JSON object
+
+        Raises:
+            TypeError, KeyError, ValueError: If the object is not a valid
+                classification
+        """
+        return cls(data['intent'], float(data['confidence']), data['rationale'])
@@ -0,0 +1,108 @@
+"""
+Keyword Intent Detection - Fallback classifier shared by the LLM services
+
+Used by the Azure OpenAI and OCI intent services when the LLM is not
+configured or returns something unparseable. Categories are checked in
+priority order: the first category with any keyword anywhere in the message
+wins.
+
+When ``pyahocorasick`` is installed all keywords are matched with a single
+Aho-Corasick automaton; otherwise a precompiled regex is used.
+"""
+
+# Standard library imports
+import re
+
+# Third-party imports (optional accelerator)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Local imports
+from services.intent_result import IntentResult
+
+# (intent, confidence, keywords) in priority order
+_KEYWORD_INTENTS = (
+    ('Incident', 0.7, ('broken', 'not working', 'error', 'failed', 'down', 'issue', 'problem', 'crash', 'hang')),
+    ('Request', 0.6, ('need', 'want', 'request', 'access', 'permission', 'account', 'user')),
+    ('Change', 0.6, ('change', 'modify', 'update', 'upgrade', 'migrate', 'deploy')),
+    ('Status', 0.7, ('status', 'check', 'ticket', 'progress', 'update')),
+    ('Knowledge', 0.6, ('how', 'what', 'where', 'when', 'why', 'help', 'guide', 'documentation')),
+)
+
+_RANKED_RESULTS = [
+    IntentResult(intent, confidence, f'Detected {intent.lower()} keywords')
+    for intent, confidence, _ in _KEYWORD_INTENTS
+]
+_KEYWORD_RESULTS = {
+    result.intent.lower(): (rank, result) for rank, result in enumerate(_RANKED_RESULTS)
+}
+
+# One named group per category inside a lookahead, so a single scan reports
+# every position where any keyword starts, including overlapping ones
+# (e.g. "hang" inside "change"), with the higher-priority category winning
+# at each position. Matching is case-insensitive, so the message is scanned
+# as-is without building a lowercased copy
+_KEYWORD_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{intent.lower()}>" + "|".join(re.escape(k) for k in keywords) + ")"
+        for intent, _, keywords in _KEYWORD_INTENTS
+    ) + ")",
+    re.IGNORECASE
+)
+
+
+def _build_automaton():
+    """Map every keyword to the rank of its highest-priority category"""
+    automaton = ahocorasick.Automaton()
+    for rank, (_, _, keywords) in reversed(list(enumerate(_KEYWORD_INTENTS))):
+        for keyword in keywords:
+            automaton.add_word(keyword, rank)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_automaton() if ahocorasick else None
+
+_OTHER = IntentResult('Other', 0.3, 'Unable to determine specific intent')
+
+# Every result detect_keyword_intent() can return, by identity
+_KEYWORD_RESULT_IDS = frozenset(id(result) for result in (*_RANKED_RESULTS, _OTHER))
+
+
+def is_keyword_result(result: IntentResult) -> bool:
+    """
+    Tell whether a result came from the keyword classifier
+
+    The LLM services fall back to keyword detection when a call fails or
+    returns something unparseable; such results should not be cached as if
+    the model had produced them.
+    """
+    return id(result) in _KEYWORD_RESULT_IDS
+
+
+def detect_keyword_intent(user_message: str) -> IntentResult:
+    """
+    Classify a message by keyword
+
+    Args:
+        user_message (str): User's message
+
+    Returns:
+        IntentResult with intent, confidence, and rationale
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        # The automaton is case-sensitive and holds lowercase keywords
+        best = min((rank for _, rank in _KEYWORD_AUTOMATON.iter(user_message.lower())), default=None)
+        return _OTHER if best is None else _RANKED_RESULTS[best]
+
+    best = None
+    for match in _KEYWORD_RE.finditer(user_message):
+        rank, result = _KEYWORD_RESULTS[match.lastgroup]
+        if best is None or rank < best[0]:
+            best = (rank, result)
+            if rank == 0:
+                break
+
+    return best[1] if best else _OTHER
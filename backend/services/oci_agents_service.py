@@ -1,6 +1,8 @@
 """
 OCI Agents Service for specific AI tasks
 """
+import asyncio
+import functools
 from typing import Dict, Any, Optional
 from config.config import Config
 import json
@@ -105,6 +107,31 @@ class OCIAgentsService:
             print(f"Error in OCI Agents ticket creation: {e}")
             return self._fallback_ticket_creation(ticket_data)
     
+    async def async_search_with_agent(self, query: str, intent: str) -> Dict[str, Any]:
+        """
+        Use OCI Agent for search without blocking the event loop
+        
+        Args:
+            query (str): Search query
+            intent (str): Intent type
+            
+        Returns:
+            Dict with search results
+        """
+        return await asyncio.to_thread(self.search_with_agent, query, intent)
+    
+    async def async_create_ticket_with_agent(self, ticket_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Use OCI Agent for ticket creation without blocking the event loop
+        
+        Args:
+            ticket_data (dict): Ticket data
+            
+        Returns:
+            Dict with ticket creation result
+        """
+        return await asyncio.to_thread(self.create_ticket_with_agent, ticket_data)
+    
     def _fallback_search(self, query: str, intent: str) -> Dict[str, Any]:
         """Fallback search when OCI Agents are not available"""
         return {
@@ -125,3 +152,9 @@ class OCIAgentsService:
             'message': 'OCI Agents not available for ticket creation',
             'agent_used': 'fallback'
         }
+
+
+@functools.lru_cache(maxsize=1)
+def get_oci_agents_service() -> OCIAgentsService:
+    """Return the process-wide OCIAgentsService, creating its clients once"""
+    return OCIAgentsService()
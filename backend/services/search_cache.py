@@ -0,0 +1,66 @@
+"""
+Search Result Cache - LRU memoization of OCI searches and their formatting
+
+The same query is often searched repeatedly (new-search loops, retries,
+several users reporting the same outage). Entries hold both the raw search
+result and its rendered markdown so a hit skips the OCI round trip and the
+formatting work. Entries expire after ``ttl_seconds`` so newly created
+tickets and articles still show up.
+"""
+
+# Standard library imports
+import threading
+import time
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Optional, Tuple
+
+
+class SearchResultCache:
+    """
+    Thread-safe LRU cache of (raw results, formatted markdown) per query.
+
+    Attributes:
+        maxsize (int): Maximum number of cached searches
+        ttl_seconds (float): How long an entry stays valid
+    """
+
+    def __init__(self, maxsize: int = 2048, ttl_seconds: float = 300):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Tuple[Any, str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(query: str, intent: str) -> str:
+        """Build the cache key from the normalized query and intent"""
+        normalized = " ".join(query.lower().split())
+        return blake2b(f"{intent}\x00{normalized}".encode(), digest_size=16).hexdigest()
+
+    def get(self, query: str, intent: str) -> Optional[Tuple[Any, str]]:
+        """Return the cached (raw, formatted) pair, or None on a miss"""
+        key = self.make_key(query, intent)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, query: str, intent: str, value: Tuple[Any, str]):
+        """Store a search result, evicting the least recently used"""
+        key = self.make_key(query, intent)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached results"""
+        with self._lock:
+            self._entries.clear()
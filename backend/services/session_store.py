@@ -0,0 +1,131 @@
+"""
+Session Store - Server-side persistence of chatbot session state
+
+Lets the API keep ``session_data`` on the server, keyed by a session id,
+instead of having the client send the full history and collected data back
+on every request. The in-memory store suits a single worker; the Redis
+store (msgpack-encoded) lets several stateless workers share sessions.
+
+A turn loads the session, processes the message (LLM and ServiceNow calls)
+and saves the session back. Updates are not merged: if two turns for the
+same session run concurrently, the last one to finish wins and the other's
+changes are lost. Clients are expected to send one message at a time per
+session.
+"""
+
+# Standard library imports
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Local imports
+from config.config import Config
+
+
+class SessionStore:
+    """
+    In-process session store with per-session expiry.
+
+    Attributes:
+        ttl_seconds (int): Idle time after which a session is discarded
+        max_history (int): Conversation turns kept per session
+    """
+
+    def __init__(self, ttl_seconds: int = None, max_history: int = None):
+        self.ttl_seconds = ttl_seconds or Config.SESSION_TTL_SECONDS
+        self.max_history = max_history or Config.SESSION_HISTORY_MAX_TURNS
+        # Ordered by expiry (every set moves a session to the end), so
+        # abandoned sessions are swept from the front
+        self._sessions: "OrderedDict[str, tuple]" = OrderedDict()
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored session, or None if unknown or expired"""
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        expires_at, session_data = entry
+        if time.monotonic() > expires_at:
+            self._sessions.pop(session_id, None)
+            return None
+        return session_data
+
+    async def set(self, session_id: str, session_data: Dict[str, Any]):
+        """Store a session and refresh its expiry"""
+        self._trim_history(session_data)
+        now = time.monotonic()
+        self._sessions[session_id] = (now + self.ttl_seconds, session_data)
+        self._sessions.move_to_end(session_id)
+
+        # Drop sessions that expired without being read again
+        while self._sessions:
+            oldest_id, (expires_at, _) = next(iter(self._sessions.items()))
+            if expires_at > now:
+                break
+            del self._sessions[oldest_id]
+
+    async def delete(self, session_id: str):
+        """Forget a session"""
+        self._sessions.pop(session_id, None)
+
+    async def close(self):
+        """Release resources held by the store"""
+        self._sessions.clear()
+
+    def _trim_history(self, session_data: Dict[str, Any]):
+        """Bound the stored conversation history to the most recent turns"""
+        history = session_data.get('conversation_history')
+        if isinstance(history, dict):
+            for column in history.values():
+                del column[:-self.max_history]
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Redis-backed session store shared by all API workers.
+
+    Sessions are msgpack-encoded and written with ``SET ... EX``, which
+    replaces the whole session (last write wins, see the module docstring)
+    and lets idle sessions expire.
+    ``redis`` and ``msgpack`` are imported lazily and only required when
+    ``SESSION_STORE=redis``.
+    """
+
+    def __init__(self, url: str = None, ttl_seconds: int = None, max_history: int = None):
+        super().__init__(ttl_seconds, max_history)
+        import msgpack
+        import redis.asyncio as redis
+
+        self._msgpack = msgpack
+        self.redis = redis.Redis.from_url(url or Config.REDIS_URL)
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"chatbot:session:{session_id}"
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored session, or None if unknown or expired"""
+        payload = await self.redis.get(self._key(session_id))
+        if payload is None:
+            return None
+        return self._msgpack.unpackb(payload, raw=False)
+
+    async def set(self, session_id: str, session_data: Dict[str, Any]):
+        """Store a session and refresh its expiry"""
+        self._trim_history(session_data)
+        payload = self._msgpack.packb(session_data, use_bin_type=True, default=str)
+        await self.redis.set(self._key(session_id), payload, ex=self.ttl_seconds)
+
+    async def delete(self, session_id: str):
+        """Forget a session"""
+        await self.redis.delete(self._key(session_id))
+
+    async def close(self):
+        """Close the Redis connection pool"""
+        await self.redis.aclose()
+
+
+def create_session_store() -> SessionStore:
+    """Build the session store selected by ``Config.SESSION_STORE``"""
+    if Config.SESSION_STORE == "redis":
+        return RedisSessionStore()
+    return SessionStore()
@@ -0,0 +1,83 @@
+"""
+Streaming JSON extraction for LLM responses
+
+LLM classifiers are asked for a JSON object but often wrap it in prose.
+``JSONObjectStream`` consumes the response as it is generated and reports
+the first complete top-level object as soon as its closing brace arrives,
+so callers can stop reading (and cancel the generation) without waiting
+for any trailing text.
+"""
+
+# Standard library imports
+import json
+from typing import Any, Dict, List, Optional
+
+
+class JSONObjectStream:
+    """
+    Single-pass incremental finder for the first JSON object in a text stream.
+
+    Tracks string/escape state and brace depth across chunks; braces inside
+    string values are ignored. Text that is not valid JSON between a matched
+    pair of braces is skipped and scanning resumes after it.
+
+    Attributes:
+        value (dict): The parsed object once complete, otherwise None
+    """
+
+    def __init__(self):
+        self.value: Optional[Dict[str, Any]] = None
+        self._parts: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume the next chunk of text
+
+        Args:
+            chunk (str): Next piece of the response
+
+        Returns:
+            bool: True once a complete object has been parsed
+        """
+        if self.value is not None:
+            return True
+
+        start = 0 if self._depth else None
+        for i, ch in enumerate(chunk):
+            if not self._depth:
+                if ch == '{':
+                    self._depth = 1
+                    start = i
+                continue
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == '\\':
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == '{':
+                self._depth += 1
+            elif ch == '}':
+                self._depth -= 1
+                if not self._depth:
+                    self._parts.append(chunk[start:i + 1])
+                    candidate = ''.join(self._parts)
+                    self._parts = []
+                    try:
+                        value = json.loads(candidate)
+                    except ValueError:
+                        continue
+                    if isinstance(value, dict):
+                        self.value = value
+                        return True
+
+        if self._depth:
+            self._parts.append(chunk[start:])
+        return False
@@ -0,0 +1,155 @@
+"""
+Ticket Caches - Short-lived memoization of ServiceNow ticket reads
+
+A ticket is typically read several times within one conversation turn
+(validate it exists, then fetch its details). Records are cached by
+(table, sys_id) for ``ttl_seconds`` and dropped whenever the ticket is
+updated through the service, so reads never outlive a known change.
+
+Duplicate checks are also re-run with identical criteria when a user
+retries; their results are cached by a hash of the canonicalized criteria
+and discarded whenever a ticket is created.
+"""
+
+# Standard library imports
+import json
+import threading
+import time
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class TicketRecordCache:
+    """
+    Thread-safe TTL LRU cache of ticket records.
+
+    Attributes:
+        maxsize (int): Maximum number of cached tickets
+        ttl_seconds (float): How long a record stays valid
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 30):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Bumped per ticket on invalidation, so a read that was in flight
+        # across an update cannot store the record it fetched before it
+        self._versions: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._invalidations = 0
+        self._lock = threading.Lock()
+
+    def version(self, table: str, ticket_id: str) -> int:
+        """Current version of a ticket, to pass to put() after reading it"""
+        with self._lock:
+            return self._versions.get((table, ticket_id), 0)
+
+    def get(self, table: str, ticket_id: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached record, or None on a miss"""
+        key = (table, ticket_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, record = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(record)
+
+    def get_with_age(self, table: str, ticket_id: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Return a copy of the cached record and its age in seconds, or None on a miss"""
+        key = (table, ticket_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            age = time.monotonic() - entry[0]
+            if age > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry[1]), age
+
+    def put(self, table: str, ticket_id: str, record: Dict[str, Any], version: Optional[int] = None):
+        """
+        Store a record, evicting the least recently used
+
+        When ``version`` (taken before the read) is given, the record is
+        discarded if the ticket was invalidated while it was being read.
+        """
+        key = (table, ticket_id)
+        with self._lock:
+            if version is not None and self._versions.get(key, 0) != version:
+                return
+            self._entries[key] = (time.monotonic(), record)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, table: str, ticket_id: str):
+        """Drop a ticket's cached record, if any"""
+        key = (table, ticket_id)
+        with self._lock:
+            self._entries.pop(key, None)
+            # Versions come from one counter, so a ticket whose version was
+            # evicted (and reads as 0) never matches a read started earlier
+            self._invalidations += 1
+            self._versions[key] = self._invalidations
+            self._versions.move_to_end(key)
+            if len(self._versions) > self.maxsize:
+                self._versions.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached records"""
+        with self._lock:
+            self._entries.clear()
+
+
+class DuplicateSearchCache:
+    """
+    Thread-safe TTL LRU cache of duplicate-search results.
+
+    Attributes:
+        maxsize (int): Maximum number of cached searches
+        ttl_seconds (float): How long a result stays valid
+    """
+
+    def __init__(self, maxsize: int = 256, ttl_seconds: float = 60):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[bytes, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(criteria: Dict[str, Any], *options: Any) -> bytes:
+        """Hash the criteria (key order independent) and search options"""
+        canonical = json.dumps([criteria, options], sort_keys=True, default=str)
+        return blake2b(canonical.encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[List[Dict[str, Any]]]:
+        """Return a copy of the cached results, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, results = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return list(results)
+
+    def put(self, key: bytes, results: List[Dict[str, Any]]):
+        """Store search results, evicting the least recently used"""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), list(results))
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached results"""
+        with self._lock:
+            self._entries.clear()
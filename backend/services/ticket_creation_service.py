@@ -30,19 +30,106 @@ Business Logic:
 """
 
 # Standard library imports
+import atexit
 import base64
+import functools
 import json
 import requests
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import socket
+import threading
+import time
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Any, Tuple
+
+# Third-party imports (optional accelerator)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Local imports
 from config.config import Config
 from config.logging_config import get_logger
+from services.ticket_cache import DuplicateSearchCache, TicketRecordCache
 
 # Initialize logger
 logger = get_logger("servicenow_service")
 
+# Request bodies are pre-encoded (the session already sends the JSON
+# Content-Type) and responses decoded from raw bytes, with orjson when
+# available and the standard library otherwise
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+# Compressed responses cut the size of large JSON query results several
+# times. urllib3 advertises exactly the codings it can decode: gzip and
+# deflate, plus br and zstd when brotli / zstandard are installed. Only send
+# these headers through urllib3-backed clients, which decode the same list.
+_ACCEPT_ENCODING = ACCEPT_ENCODING
+
+# urllib3's defaults already disable Nagle (TCP_NODELAY); keepalive probes
+# also let idle pooled connections that were dropped be detected
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+
+class _SocketOptionsAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections use ``_SOCKET_OPTIONS``"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = _SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+# Failures a ServiceNow call can raise: transport errors and undecodable
+# responses (JSON decode errors are ValueErrors). Anything else
+# is a bug and propagates.
+_REQUEST_ERRORS = (requests.RequestException, ValueError)
+
+# Encoded queries separate terms with "^" and values with ","; neither can
+# be escaped, so they are blanked out of every user-supplied value (NULs
+# are dropped). Values are not percent-encoded here: requests encodes the
+# whole sysparm_query once.
+_SN_QUERY_TRANS = str.maketrans({"^": " ", ",": " ", "\x00": None})
+
+# Duplicate searches only look at tickets created in the last 30 days
+_DUPLICATE_WINDOW_SECONDS = 30 * 24 * 60 * 60
+
+# Timestamp format for the chatbot work note on new tickets
+_WORK_NOTE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@functools.lru_cache(maxsize=1)
+def _duplicate_cutoff_clause(today: Tuple[int, int, int]) -> str:
+    """Build the created-since clause for duplicate searches, once per local day"""
+    cutoff = time.strftime("%Y-%m-%d", time.localtime(time.time() - _DUPLICATE_WINDOW_SECONDS))
+    return f"sys_created_on>={cutoff}"
+
+
+@functools.lru_cache(maxsize=4)
+def _build_headers(username: str, password: str) -> MappingProxyType:
+    """
+    Build the request headers, encoding each credential pair once.
+    
+    The mapping is read-only so one instance can be shared by every
+    service and its HTTP clients.
+    """
+    credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
+    return MappingProxyType({
+        "Authorization": f"Basic {credentials}",
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        "Accept-Encoding": _ACCEPT_ENCODING
+    })
+
 
 class ServiceNowTicketService:
     """
@@ -59,7 +146,7 @@ class ServiceNowTicketService:
         password (str): ServiceNow authentication password
         api_version (str): ServiceNow API version to use
         timeout (int): Request timeout in seconds
-        headers (dict): HTTP headers with authentication
+        headers (Mapping): Read-only HTTP headers with authentication
         
     Methods:
         search_duplicates(): Search for potential duplicate tickets
@@ -75,6 +162,76 @@ class ServiceNowTicketService:
         - Provides comprehensive error handling and logging
     """
     
+    # Ticket type -> ServiceNow table (tables are their own sys_class_name)
+    _TYPE_TO_TABLE = {
+        "incident": "incident",
+        "request": "sc_request",
+        "change": "change_request",
+        "problem": "problem"
+    }
+    
+    # Ticket type -> (table, sys_class_name clause) for duplicate searches;
+    # untyped searches look in the incident table without a class filter
+    _DUP_TYPE_META = {
+        ticket_type: (table, f"sys_class_name={table}")
+        for ticket_type, table in _TYPE_TO_TABLE.items()
+    }
+    _DUP_DEFAULT_META = ("incident", None)
+    
+    # Ticket type -> how a new ticket's payload is built. Every type sends
+    # the common fields; the caller is stored in a type-specific field and
+    # some types add extra fields with defaults.
+    _CREATE_SPEC = {
+        "incident": {
+            "name": "incident",
+            "caller_field": "caller_id",
+            "default_caller": True,
+            "extras": (("urgency", "3"), ("impact", "3")),
+            "work_note": "Ticket created"
+        },
+        "request": {
+            "name": "service request",
+            "caller_field": "requested_for",
+            "default_caller": False,
+            "extras": (),
+            "work_note": "Service request created"
+        },
+        "change": {
+            "name": "change request",
+            "caller_field": "requested_by",
+            "default_caller": False,
+            "extras": (("change_type", "Minor"), ("risk", "Low")),
+            "work_note": "Change request created"
+        },
+        "problem": {
+            "name": "problem",
+            "caller_field": "reported_by",
+            "default_caller": False,
+            "extras": (),
+            "work_note": "Problem ticket created"
+        }
+    }
+    
+    # Fields the duplicate decision uses (similarity scoring and state);
+    # returned by default
+    _DUP_MATCH_FIELDS = "sys_id,number,short_description,category,priority,state,created,sys_created_on,caller_id"
+    
+    # Full duplicate records for display, fetched on request
+    _DUP_FIELDS = "sys_id,number,short_description,description,category,priority,state,assigned_to,created,resolved,work_notes,caller_id"
+    
+    # Read options that skip work the chatbot never uses: reference fields
+    # come back as plain sys_id values without link objects, no display
+    # values are resolved and no pagination headers are computed
+    _LEAN_READ_PARAMS = {
+        "sysparm_exclude_reference_link": "true",
+        "sysparm_suppress_pagination_header": "true",
+        "sysparm_display_value": "false"
+    }
+    
+    # Active tickets only. ServiceNow state values: 1=New, 2=In Progress,
+    # 6=Resolved, 7=Closed
+    _ACTIVE_STATE_CLAUSE = "state!=6^state!=7"
+    
     def __init__(self):
         """
         Initialize ServiceNow service with configuration and authentication.
@@ -87,12 +244,8 @@ class ServiceNowTicketService:
             ValueError: If required configuration is missing
             ConnectionError: If ServiceNow instance is unreachable
         """
-        # Clean and validate instance URL
-        raw_url = Config.SERVICENOW_INSTANCE_URL
-        self.instance_url = raw_url.replace(
-            "/login.do?user_name=admin&sys_action=sysverb_login&user_password=Bb7Q8Iqp%2Fp-B", 
-            ""
-        )
+        # Clean instance URL: drop any pasted login page and trailing slash
+        self.instance_url = Config.SERVICENOW_INSTANCE_URL.split("/login.do", 1)[0].rstrip("/")
         
         # Set authentication credentials
         self.username = Config.SERVICENOW_USERNAME
@@ -101,18 +254,54 @@ class ServiceNowTicketService:
         self.timeout = int(Config.SERVICENOW_TIMEOUT)
         
         # Create basic authentication header
-        credentials = f"{self.username}:{self.password}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
-        self.headers = {
-            "Authorization": f"Basic {encoded_credentials}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
+        self.headers = _build_headers(self.username, self.password)
+        
+        # Table API and record UI URLs for the known tables, built once
+        self._table_urls = {
+            table: f"{self.instance_url}/api/now/table/{table}"
+            for table in self._TYPE_TO_TABLE.values()
+        }
+        self._ticket_url_fmt = {
+            table: f"{self.instance_url}/{table}.do?sys_id=%s"
+            for table in self._TYPE_TO_TABLE.values()
         }
         
-        logger.info(f"ServiceNow service initialized for instance: {self.instance_url}")
-        logger.info(f"API version: {self.api_version}, Timeout: {self.timeout}s")
+        # One pooled session for all calls so TCP/TLS connections are reused.
+        # Only reads are retried: replaying a POST after a gateway error
+        # could create the same ticket twice.
+        self.session = requests.Session()
+        adapter = _SocketOptionsAdapter(
+            pool_connections=10,
+            pool_maxsize=Config.SERVICENOW_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                status_forcelist=[429, 502, 503, 504],
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(self.headers)
+        atexit.register(self.session.close)
+        
+        # Ticket reads repeated within a conversation are served from memory
+        self.ticket_cache = TicketRecordCache(ttl_seconds=Config.SERVICENOW_TICKET_CACHE_TTL_SECONDS)
+        self.duplicate_cache = DuplicateSearchCache(ttl_seconds=Config.SERVICENOW_DUPLICATE_CACHE_TTL_SECONDS)
+        
+        # Cached tickets close to expiry are re-read in the background, so
+        # hot tickets are not re-fetched on the request path
+        self.refresh_ahead_seconds = Config.SERVICENOW_TICKET_REFRESH_AHEAD_SECONDS
+        self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ticket-refresh")
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        
+        logger.info("ServiceNow service initialized for instance: %s", self.instance_url)
+        logger.info("API version: %s, Timeout: %ss", self.api_version, self.timeout)
     
-    def search_duplicates(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def search_duplicates(self, criteria: Dict[str, Any], limit: int = 20,
+                          fields: Optional[str] = None, include_body: bool = False) -> List[Dict[str, Any]]:
         """
         Search for potential duplicate tickets using comprehensive criteria.
         
@@ -129,13 +318,20 @@ class ServiceNowTicketService:
                 - category (str): Category for filtering
                 - priority (str): Priority level
                 - time_window_days (int): Days to search back
+            limit (int): Maximum number of tickets to return
+            fields (str): Comma-separated fields to return instead of the
+                default field list
+            include_body (bool): Return the full records (description,
+                assignment, work notes) instead of only the fields used to
+                decide whether a ticket is a duplicate; see also
+                ``fetch_duplicate_bodies``
                 
         Returns:
             List[Dict[str, Any]]: List of potential duplicate tickets with:
                 - sys_id: ServiceNow system ID
                 - number: Ticket number
                 - short_description: Brief description
-                - description: Full description
+                - description: Full description (include_body only)
                 - state: Current ticket state
                 - priority: Priority level
                 - category: Category classification
@@ -152,341 +348,349 @@ class ServiceNowTicketService:
             - Orders results by creation date (newest first)
             - Limits results to prevent performance issues
         """
-        logger.info(f"Searching for duplicate tickets with criteria: {criteria}")
+        logger.info("Searching for duplicate tickets with criteria: %s", criteria)
+        
+        cache_key = self.duplicate_cache.make_key(criteria, limit, fields, include_body)
+        cached = self.duplicate_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Found %s potential duplicates (cached)", len(cached))
+            return cached
         
         try:
-            # Build comprehensive search query with active state filtering
-            query_parts = []
-            
-            # Critical: Only search active tickets (exclude resolved/closed)
-            query_parts.append("state!=6^state!=7")  # Not resolved or closed
-            
-            if criteria.get("user_id"):
-                query_parts.append(f"caller_id={criteria['user_id']}")
-            
-            if criteria.get("ticket_type"):
-                if criteria["ticket_type"] == "incident":
-                    query_parts.append("sys_class_name=incident")
-                elif criteria["ticket_type"] == "request":
-                    query_parts.append("sys_class_name=sc_request")
-                elif criteria["ticket_type"] == "change":
-                    query_parts.append("sys_class_name=change_request")
-                elif criteria["ticket_type"] == "problem":
-                    query_parts.append("sys_class_name=problem")
-            
-            if criteria.get("description"):
-                # Search in short_description and description
-                desc = criteria["description"].replace("'", "\\'")
-                query_parts.append(f"short_descriptionCONTAINS{desc}^ORdescriptionCONTAINS{desc}")
-            
-            if criteria.get("category"):
-                query_parts.append(f"category={criteria['category']}")
-            
-            # Add time filter (last 30 days)
-            thirty_days_ago = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-            query_parts.append(f"sys_created_on>={thirty_days_ago}")
-            
-            # CRITICAL: Filter for active ticket states only (New, Open, In Progress)
-            # ServiceNow state values: 1=New, 2=In Progress, 6=Resolved, 7=Closed
-            query_parts.append("state!=6^state!=7")  # Exclude Resolved and Closed
-            
-            search_query = "^".join(query_parts)
-            
-            # Search parameters
-            search_params = {
-                "sysparm_query": search_query,
-                "sysparm_limit": "20",
-                "sysparm_fields": "sys_id,number,short_description,description,category,priority,state,assigned_to,created,resolved,work_notes,caller_id"
-            }
-            
-            # Determine table based on ticket type
-            table = "incident"
-            if criteria.get("ticket_type") == "request":
-                table = "sc_request"
-            elif criteria.get("ticket_type") == "change":
-                table = "change_request"
-            elif criteria.get("ticket_type") == "problem":
-                table = "problem"
-            
-            url = f"{self.instance_url}/api/now/table/{table}"
-            logger.debug(f"Searching duplicates in table: {table}")
-            logger.debug(f"Search query: {search_query}")
+            table, search_params = self._duplicate_search(criteria, limit, fields, include_body)
+            url = self._table_url(table)
             
-            response = requests.get(url, headers=self.headers, params=search_params, timeout=self.timeout)
+            response = self.session.get(url, params=search_params, timeout=self.timeout)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 results = data.get("result", [])
-                logger.info(f"Found {len(results)} potential duplicates")
+                self.duplicate_cache.put(cache_key, results)
+                logger.info("Found %s potential duplicates", len(results))
                 return results
             else:
-                logger.error(f"Duplicate search failed: {response.status_code} - {response.text}")
+                logger.error("Duplicate search failed: %s - %s", response.status_code, response.text)
                 return []
                 
-        except Exception as e:
-            logger.error(f"Error searching duplicates: {str(e)}")
+        except _REQUEST_ERRORS as e:
+            logger.error("Error searching duplicates: %s", e)
             return []
     
-    def create_incident(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create incident ticket in ServiceNow"""
-        logger.info(f"Creating incident ticket with data: {data.get('short_description', 'No description')}")
+    def fetch_duplicate_bodies(self, sys_ids: List[str], ticket_type: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get full records for the duplicates that will actually be shown.
         
-        try:
-            # Format data for ServiceNow
-            default_caller = Config.SERVICENOW_DEFAULT_CALLER_ID
-            incident_data = {
-                "short_description": data.get("short_description", ""),
-                "description": data.get("description", ""),
-                "category": data.get("category", "General"),
-                "priority": data.get("priority", "3"),
-                "urgency": data.get("urgency", "3"),
-                "impact": data.get("impact", "3"),
-                "caller_id": data.get("caller_id", default_caller),
-                "assigned_to": data.get("assigned_to", ""),
-                "assignment_group": data.get("assignment_group", ""),
-                "work_notes": f"Ticket created via chatbot on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            }
-            
-            url = f"{self.instance_url}/api/now/table/incident"
-            response = requests.post(url, headers=self.headers, json=incident_data, timeout=self.timeout)
+        Duplicate searches return only the fields needed for matching; the
+        few records presented to the user are completed with one
+        ``sys_idIN`` query.
+        
+        Args:
+            sys_ids (List[str]): sys_ids of the duplicates to complete
+            ticket_type (str): Ticket type the duplicates were searched in
             
-            if response.status_code == 201:
-                result = response.json().get("result", {})
-                ticket_id = result.get("sys_id", "")
-                ticket_number = result.get("number", "")
-                ticket_url = f"{self.instance_url}/incident.do?sys_id={ticket_id}"
-                
-                logger.info(f"Incident created successfully: {ticket_number} ({ticket_id})")
-                
-                return {
-                    "success": True,
-                    "ticket_id": ticket_id,
-                    "ticket_number": ticket_number,
-                    "ticket_url": ticket_url,
-                    "table": "incident"
-                }
-            else:
-                logger.error(f"Incident creation failed: {response.status_code} - {response.text}")
-                return {
-                    "success": False,
-                    "error": f"ServiceNow API error: {response.status_code}",
-                    "details": response.text
-                }
+        Returns:
+            Dict[str, Dict[str, Any]]: Full records keyed by sys_id ({} on error)
+        """
+        if not sys_ids:
+            return {}
+        
+        table = self._TYPE_TO_TABLE.get(ticket_type) or "incident"
+        params = {
+            "sysparm_query": f"sys_idIN{','.join(sys_ids)}",
+            "sysparm_limit": str(len(sys_ids)),
+            "sysparm_fields": self._DUP_FIELDS,
+            **self._LEAN_READ_PARAMS
+        }
+        try:
+            response = self.session.get(self._table_url(table), params=params, timeout=self.timeout)
+            if response.status_code != 200:
+                logger.error("Duplicate body fetch failed: %s - %s", response.status_code, response.text)
+                return {}
+            return {record.get("sys_id", ""): record for record in _loads(response.content).get("result", [])}
+        except _REQUEST_ERRORS as e:
+            logger.error("Error fetching duplicate bodies: %s", e)
+            return {}
+    
+    def _duplicate_search(self, criteria: Dict[str, Any], limit: int, fields: Optional[str],
+                          include_body: bool) -> Tuple[str, Dict[str, str]]:
+        """Build the table and query parameters for a duplicate search"""
+        # Build comprehensive search query with active state filtering
+        # Critical: Only search active tickets (exclude resolved/closed)
+        query_parts = [self._ACTIVE_STATE_CLAUSE]
+        
+        if criteria.get("user_id"):
+            query_parts.append(f"caller_id={str(criteria['user_id']).translate(_SN_QUERY_TRANS)}")
+        
+        table, class_clause = self._DUP_TYPE_META.get(criteria.get("ticket_type"), self._DUP_DEFAULT_META)
+        if class_clause:
+            query_parts.append(class_clause)
+        
+        if criteria.get("description"):
+            # Search in short_description and description
+            desc = criteria["description"].translate(_SN_QUERY_TRANS)
+            query_parts.append(f"short_descriptionCONTAINS{desc}^ORdescriptionCONTAINS{desc}")
+        
+        if criteria.get("category"):
+            query_parts.append(f"category={str(criteria['category']).translate(_SN_QUERY_TRANS)}")
+        
+        # Add time filter (last 30 days)
+        query_parts.append(_duplicate_cutoff_clause(time.localtime()[:3]))
+        
+        search_query = "^".join(query_parts)
+        
+        logger.debug("Searching duplicates in table: %s", table)
+        logger.debug("Search query: %s", search_query)
+        
+        # Search parameters
+        if not fields:
+            fields = self._DUP_FIELDS if include_body else self._DUP_MATCH_FIELDS
+        return table, {
+            "sysparm_query": search_query,
+            "sysparm_limit": str(limit),
+            "sysparm_fields": fields,
+            **self._LEAN_READ_PARAMS
+        }
+    
+    def create_ticket(self, ticket_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a ticket of any supported type in ServiceNow.
+        
+        The payload, table and messages come from ``_CREATE_SPEC``, so all
+        ticket types share one request/response path.
+        
+        Args:
+            ticket_type (str): incident, request, change or problem
+            data (Dict[str, Any]): Ticket fields (short_description,
+                description, category, priority, caller_id, ...)
                 
-        except Exception as e:
-            logger.error(f"Error creating incident: {str(e)}")
+        Returns:
+            Dict[str, Any]: Creation result with success flag, ticket_id,
+                ticket_number, ticket_url and table, or error details
+        """
+        spec = self._CREATE_SPEC.get(ticket_type)
+        if spec is None:
             return {
                 "success": False,
-                "error": str(e)
+                "error": f"Unsupported ticket type: {ticket_type}"
             }
-    
-    def create_service_request(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create service request in ServiceNow"""
-        logger.info(f"Creating service request with data: {data.get('short_description', 'No description')}")
+        name = spec["name"]
+        table = self._TYPE_TO_TABLE[ticket_type]
+        logger.info("Creating %s with data: %s", name, data.get('short_description', 'No description'))
         
         try:
-            # Format data for ServiceNow
-            request_data = {
-                "short_description": data.get("short_description", ""),
-                "description": data.get("description", ""),
-                "category": data.get("category", "General"),
-                "priority": data.get("priority", "3"),
-                "requested_for": data.get("caller_id", ""),
-                "assigned_to": data.get("assigned_to", ""),
-                "assignment_group": data.get("assignment_group", ""),
-                "work_notes": f"Service request created via chatbot on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            }
-            
-            url = f"{self.instance_url}/api/now/table/sc_request"
-            response = requests.post(url, headers=self.headers, json=request_data, timeout=self.timeout)
-            
-            if response.status_code == 201:
-                result = response.json().get("result", {})
-                ticket_id = result.get("sys_id", "")
-                ticket_number = result.get("number", "")
-                ticket_url = f"{self.instance_url}/sc_request.do?sys_id={ticket_id}"
-                
-                logger.info(f"Service request created successfully: {ticket_number} ({ticket_id})")
-                
-                return {
-                    "success": True,
-                    "ticket_id": ticket_id,
-                    "ticket_number": ticket_number,
-                    "ticket_url": ticket_url,
-                    "table": "sc_request"
-                }
-            else:
-                logger.error(f"Service request creation failed: {response.status_code} - {response.text}")
-                return {
-                    "success": False,
-                    "error": f"ServiceNow API error: {response.status_code}",
-                    "details": response.text
-                }
-                
-        except Exception as e:
-            logger.error(f"Error creating service request: {str(e)}")
+            ticket_data = self._ticket_payload(spec, data)
+            result = self._post_ticket(table, ticket_data)
+        except _REQUEST_ERRORS as e:
+            logger.error("Error creating %s: %s", name, e)
             return {
                 "success": False,
                 "error": str(e)
             }
+        
+        if result["success"]:
+            logger.info("%s created successfully: %s (%s)", name.capitalize(), result['ticket_number'], result['ticket_id'])
+            # A new ticket can be a duplicate candidate for later checks
+            self.clear_duplicate_cache()
+        else:
+            logger.error("%s creation failed: %s", name.capitalize(), result['error'])
+        return result
     
-    def create_change_request(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create change request in ServiceNow"""
-        logger.info(f"Creating change request with data: {data.get('short_description', 'No description')}")
+    def _ticket_payload(self, spec: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
+        """Format ticket fields for ServiceNow following a ``_CREATE_SPEC`` entry"""
+        get = data.get
+        caller_default = Config.SERVICENOW_DEFAULT_CALLER_ID if spec["default_caller"] else ""
+        ticket_data = {
+            "short_description": get("short_description", ""),
+            "description": get("description", ""),
+            "category": get("category", "General"),
+            "priority": get("priority", "3"),
+            spec["caller_field"]: get("caller_id", caller_default),
+            "assigned_to": get("assigned_to", ""),
+            "assignment_group": get("assignment_group", "")
+        }
+        for field, default in spec["extras"]:
+            ticket_data[field] = get(field, default)
+        ticket_data["work_notes"] = f"{spec['work_note']} via chatbot on {time.strftime(_WORK_NOTE_TIME_FORMAT)}"
+        return ticket_data
+    
+    def _post_ticket(self, table: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POST a new record to a table and shape the creation result.
         
-        try:
-            # Format data for ServiceNow
-            change_data = {
-                "short_description": data.get("short_description", ""),
-                "description": data.get("description", ""),
-                "category": data.get("category", "General"),
-                "priority": data.get("priority", "3"),
-                "requested_by": data.get("caller_id", ""),
-                "assigned_to": data.get("assigned_to", ""),
-                "assignment_group": data.get("assignment_group", ""),
-                "change_type": data.get("change_type", "Minor"),
-                "risk": data.get("risk", "Low"),
-                "work_notes": f"Change request created via chatbot on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            }
-            
-            url = f"{self.instance_url}/api/now/table/change_request"
-            response = requests.post(url, headers=self.headers, json=change_data, timeout=self.timeout)
-            
-            if response.status_code == 201:
-                result = response.json().get("result", {})
-                ticket_id = result.get("sys_id", "")
-                ticket_number = result.get("number", "")
-                ticket_url = f"{self.instance_url}/change_request.do?sys_id={ticket_id}"
-                
-                logger.info(f"Change request created successfully: {ticket_number} ({ticket_id})")
-                
-                return {
-                    "success": True,
-                    "ticket_id": ticket_id,
-                    "ticket_number": ticket_number,
-                    "ticket_url": ticket_url,
-                    "table": "change_request"
-                }
-            else:
-                logger.error(f"Change request creation failed: {response.status_code} - {response.text}")
-                return {
-                    "success": False,
-                    "error": f"ServiceNow API error: {response.status_code}",
-                    "details": response.text
-                }
-                
-        except Exception as e:
-            logger.error(f"Error creating change request: {str(e)}")
+        Returns:
+            Dict[str, Any]: success flag with ticket_id, ticket_number,
+                ticket_url and table, or error and details
+        """
+        response = self._post(self._table_url(table), payload)
+        if response.status_code != 201:
             return {
                 "success": False,
-                "error": str(e)
+                "error": f"ServiceNow API error: {response.status_code}",
+                "details": response.text
             }
+        
+        result = _loads(response.content).get("result", {})
+        ticket_id = result.get("sys_id", "")
+        return {
+            "success": True,
+            "ticket_id": ticket_id,
+            "ticket_number": result.get("number", ""),
+            "ticket_url": self._ticket_url_fmt[table] % ticket_id,
+            "table": table
+        }
+    
+    def create_incident(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create incident ticket in ServiceNow"""
+        return self.create_ticket("incident", data)
+    
+    def create_service_request(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create service request in ServiceNow"""
+        return self.create_ticket("request", data)
+    
+    def create_change_request(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create change request in ServiceNow"""
+        return self.create_ticket("change", data)
     
     def create_problem(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create problem ticket in ServiceNow"""
-        logger.info(f"Creating problem ticket with data: {data.get('short_description', 'No description')}")
-        
-        try:
-            # Format data for ServiceNow
-            problem_data = {
-                "short_description": data.get("short_description", ""),
-                "description": data.get("description", ""),
-                "category": data.get("category", "General"),
-                "priority": data.get("priority", "3"),
-                "reported_by": data.get("caller_id", ""),
-                "assigned_to": data.get("assigned_to", ""),
-                "assignment_group": data.get("assignment_group", ""),
-                "work_notes": f"Problem ticket created via chatbot on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            }
-            
-            url = f"{self.instance_url}/api/now/table/problem"
-            response = requests.post(url, headers=self.headers, json=problem_data, timeout=self.timeout)
-            
-            if response.status_code == 201:
-                result = response.json().get("result", {})
-                ticket_id = result.get("sys_id", "")
-                ticket_number = result.get("number", "")
-                ticket_url = f"{self.instance_url}/problem.do?sys_id={ticket_id}"
-                
-                logger.info(f"Problem ticket created successfully: {ticket_number} ({ticket_id})")
-                
-                return {
-                    "success": True,
-                    "ticket_id": ticket_id,
-                    "ticket_number": ticket_number,
-                    "ticket_url": ticket_url,
-                    "table": "problem"
-                }
-            else:
-                logger.error(f"Problem creation failed: {response.status_code} - {response.text}")
-                return {
-                    "success": False,
-                    "error": f"ServiceNow API error: {response.status_code}",
-                    "details": response.text
-                }
-                
-        except Exception as e:
-            logger.error(f"Error creating problem: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return self.create_ticket("problem", data)
     
     def validate_ticket_exists(self, ticket_id: str, table: str) -> bool:
         """Validate that a ticket exists in ServiceNow"""
-        logger.debug(f"Validating ticket exists: {ticket_id} in table: {table}")
+        logger.debug("Validating ticket exists: %s in table: %s", ticket_id, table)
         
+        if self.ticket_cache.get(table, ticket_id) is not None:
+            logger.debug("Ticket validation served from cache: %s", ticket_id)
+            return True
+        
+        version = self.ticket_cache.version(table, ticket_id)
         try:
-            url = f"{self.instance_url}/api/now/table/{table}/{ticket_id}"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            url = f"{self._table_url(table)}/{ticket_id}"
+            response = self.session.get(url, params=self._LEAN_READ_PARAMS, timeout=self.timeout)
             
             if response.status_code == 200:
-                logger.debug(f"Ticket validation successful: {ticket_id}")
+                # Keep the record so a following details lookup is free
+                self.ticket_cache.put(table, ticket_id, _loads(response.content).get("result", {}), version)
+                logger.debug("Ticket validation successful: %s", ticket_id)
                 return True
             else:
-                logger.warning(f"Ticket validation failed: {ticket_id} - {response.status_code}")
+                logger.warning("Ticket validation failed: %s - %s", ticket_id, response.status_code)
                 return False
                 
-        except Exception as e:
-            logger.error(f"Error validating ticket: {str(e)}")
+        except _REQUEST_ERRORS as e:
+            logger.error("Error validating ticket: %s", e)
             return False
     
     def get_ticket_details(self, ticket_id: str, table: str) -> Dict[str, Any]:
-        """Get detailed ticket information"""
-        logger.debug(f"Getting ticket details: {ticket_id} from table: {table}")
+        """
+        Get detailed ticket information, serving cached records immediately
         
+        A cached record close to expiry is still returned, and a background
+        read refreshes it (stale-while-revalidate).
+        
+        Args:
+            ticket_id (str): Ticket sys_id
+            table (str): Table the ticket is in
+            
+        Returns:
+            Dict[str, Any]: Ticket record, or {} if it could not be retrieved
+        """
+        entry = self.ticket_cache.get_with_age(table, ticket_id)
+        if entry is not None:
+            record, age = entry
+            if age >= self.ticket_cache.ttl_seconds - self.refresh_ahead_seconds:
+                self._refresh_ticket(table, ticket_id)
+            logger.debug("Ticket details served from cache: %s", ticket_id)
+            return record
+        
+        return self._load_ticket(table, ticket_id)
+    
+    def _refresh_ticket(self, table: str, ticket_id: str):
+        """Re-read a cached ticket in the background, at most once at a time"""
+        key = (table, ticket_id)
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        
+        def _done(_):
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+        
+        self._refresh_executor.submit(self._load_ticket, table, ticket_id).add_done_callback(_done)
+    
+    def _load_ticket(self, table: str, ticket_id: str) -> Dict[str, Any]:
+        """Read a ticket from ServiceNow and cache it"""
+        logger.debug("Getting ticket details: %s from table: %s", ticket_id, table)
+        # An update that lands while the read is in flight wins over its result
+        version = self.ticket_cache.version(table, ticket_id)
         try:
-            url = f"{self.instance_url}/api/now/table/{table}/{ticket_id}"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            url = f"{self._table_url(table)}/{ticket_id}"
+            response = self.session.get(url, params=self._LEAN_READ_PARAMS, timeout=self.timeout)
             
             if response.status_code == 200:
-                result = response.json().get("result", {})
-                logger.debug(f"Retrieved ticket details for: {ticket_id}")
+                result = _loads(response.content).get("result", {})
+                self.ticket_cache.put(table, ticket_id, dict(result), version)
+                logger.debug("Retrieved ticket details for: %s", ticket_id)
                 return result
             else:
-                logger.error(f"Failed to get ticket details: {ticket_id} - {response.status_code}")
+                logger.error("Failed to get ticket details: %s - %s", ticket_id, response.status_code)
                 return {}
                 
-        except Exception as e:
-            logger.error(f"Error getting ticket details: {str(e)}")
+        except _REQUEST_ERRORS as e:
+            logger.error("Error getting ticket details: %s", e)
             return {}
     
+    def _table_url(self, table: str) -> str:
+        """Table API URL for a table, precomputed for the ticket tables"""
+        url = self._table_urls.get(table)
+        return url if url is not None else f"{self.instance_url}/api/now/table/{table}"
+    
+    def _post(self, url: str, payload: Optional[Dict[str, Any]]) -> requests.Response:
+        """POST a JSON payload through the pooled session"""
+        body = _dumps(payload) if payload is not None else None
+        return self.session.post(url, data=body, timeout=self.timeout)
+    
+    def _patch(self, url: str, payload: Optional[Dict[str, Any]]) -> requests.Response:
+        """PATCH a JSON payload through the pooled session"""
+        body = _dumps(payload) if payload is not None else None
+        return self.session.patch(url, data=body, timeout=self.timeout)
+    
+    def close(self):
+        """Close the pooled session's connections"""
+        self._refresh_executor.shutdown(wait=False)
+        self.session.close()
+    
+    def clear_duplicate_cache(self):
+        """Forget all cached duplicate-search results"""
+        self.duplicate_cache.clear()
+    
+    def invalidate_ticket(self, table: str, ticket_id: str):
+        """Forget the cached record for a ticket that has been changed"""
+        self.ticket_cache.invalidate(table, ticket_id)
+    
     def _make_request(self, method: str, url: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
         """Make HTTP request to ServiceNow"""
+        # Writes to a ticket record make any cached copy stale
+        if method.upper() != "GET" and "/api/now/table/" in url:
+            path = url.split("/api/now/table/", 1)[1].split("?", 1)[0].strip("/").split("/")
+            if len(path) == 2:
+                self.invalidate_ticket(*path)
+        
         try:
             if method.upper() == "GET":
-                response = requests.get(url, headers=self.headers, timeout=self.timeout)
+                response = self.session.get(url, timeout=self.timeout)
             elif method.upper() == "POST":
-                response = requests.post(url, headers=self.headers, json=data, timeout=self.timeout)
+                response = self._post(url, data)
             elif method.upper() == "PATCH":
-                response = requests.patch(url, headers=self.headers, json=data, timeout=self.timeout)
+                response = self._patch(url, data)
             else:
                 return {"success": False, "error": f"Unsupported method: {method}"}
             
             if response.status_code in [200, 201, 204]:
                 return {
                     "success": True,
-                    "data": response.json() if response.content else {}
+                    "data": _loads(response.content) if response.content else {}
                 }
             else:
                 return {
@@ -494,8 +698,19 @@ class ServiceNowTicketService:
                     "error": f"HTTP {response.status_code}: {response.text}"
                 }
                 
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             return {
                 "success": False,
                 "error": str(e)
             }
+
+
+@functools.lru_cache(maxsize=1)
+def get_servicenow_service() -> ServiceNowTicketService:
+    """
+    Return the process-wide ServiceNowTicketService.
+    
+    Sharing one instance shares its pooled session and ticket cache
+    across all agents instead of building them per agent.
+    """
+    return ServiceNowTicketService()
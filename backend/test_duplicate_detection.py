@@ -6,18 +6,36 @@ Shows exactly how duplicate detection works with similar tickets
 import sys
 import os
 import time
+import asyncio
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from demo_console import tolerate_unencodable_output
+tolerate_unencodable_output()
+
 from agents.fast_ticket_creation_agent import FastGoogleADKTicketCreationAgent
+from demo_ticket_cache import cached_create_ticket
+from config.logging_config import get_logger
+
+logger = get_logger("duplicate_detection_demo")
+
+UNIQUE_TICKET = "I need a new external monitor for my workstation. My current single monitor setup is limiting my productivity when working with multiple spreadsheets and client data. My manager has approved the hardware purchase."
+
+async def _timed_create_ticket(agent, request, user):
+    """Create a ticket on a worker thread, returning the result and its duration"""
+    start = time.perf_counter()
+    result = await asyncio.to_thread(cached_create_ticket, agent, request, user)
+    return result, time.perf_counter() - start
 
-def demonstrate_duplicate_detection():
+async def _create_tickets_concurrently(requests):
+    """Create independent tickets in parallel; requests are (agent, text, user) triples"""
+    return await asyncio.gather(*(_timed_create_ticket(agent, text, user) for agent, text, user in requests))
+
+def demonstrate_duplicate_detection(agent):
     """Demonstrate duplicate detection with very similar tickets"""
     print("🔍 DUPLICATE DETECTION DEMONSTRATION")
     print("="*60)
     
-    agent = FastGoogleADKTicketCreationAgent()
-    
     # Scenario: User creates similar tickets
     print("\n👤 User: John Smith (john.smith@company.com)")
     print("🏢 Department: IT Support")
@@ -30,9 +48,9 @@ def demonstrate_duplicate_detection():
     print(f"💬 User Request: \"{first_ticket}\"")
     print("⏰ Time: 10:00 AM")
     
-    start = time.time()
-    result1 = agent.create_ticket(first_ticket, "john.smith@company.com")
-    time1 = time.time() - start
+    start = time.perf_counter()
+    result1 = cached_create_ticket(agent, first_ticket, "john.smith@company.com")
+    time1 = time.perf_counter() - start
     
     print(f"\n📊 Result 1:")
     print(f"   Success: {result1.get('success')}")
@@ -40,9 +58,7 @@ def demonstrate_duplicate_detection():
     if result1.get('success'):
         print(f"   Agent detected this as a new, unique issue")
     
-    # Wait a bit
     print("\n⏳ [15 minutes later...]")
-    time.sleep(2)
     
     # Second ticket - Very similar issue  
     print("\n🎬 SECOND TICKET (Similar Issue):")
@@ -52,9 +68,15 @@ def demonstrate_duplicate_detection():
     print(f"💬 User Request: \"{second_ticket}\"")
     print("⏰ Time: 10:15 AM")
     
-    start = time.time()
-    result2 = agent.create_ticket(second_ticket, "john.smith@company.com")
-    time2 = time.time() - start
+    # The second ticket depends on the first existing; Maria's unique ticket
+    # does not, so it is created alongside the second one
+    # An agent holds one chat session and is not thread-safe, so the
+    # concurrent ticket gets an agent of its own
+    unique_agent = FastGoogleADKTicketCreationAgent()
+    (result2, time2), unique_run = asyncio.run(_create_tickets_concurrently([
+        (agent, second_ticket, "john.smith@company.com"),
+        (unique_agent, UNIQUE_TICKET, "maria.garcia@company.com"),
+    ]))
     
     print(f"\n📊 Result 2:")
     print(f"   Success: {result2.get('success')}")
@@ -82,29 +104,36 @@ def demonstrate_duplicate_detection():
     print("   • Improves support efficiency")
     print("   • Reduces ticket backlog")
     
-    return result1, result2
+    return result1, result2, unique_run
 
-def demonstrate_non_duplicate_flow():
-    """Demonstrate legitimate new ticket creation"""
+def demonstrate_non_duplicate_flow(agent, unique_run=None):
+    """
+    Demonstrate legitimate new ticket creation
+    
+    Args:
+        agent: Ticket creation agent shared with the other scenarios
+        unique_run: (result, processing_time) if the ticket was already created
+    """
     print("\n\n🆕 NON-DUPLICATE TICKET DEMONSTRATION")
     print("="*60)
     
-    agent = FastGoogleADKTicketCreationAgent()
-    
     print("\n👤 User: Maria Garcia (maria.garcia@company.com)")
     print("🏢 Department: Sales")
     
     # Completely different issue
     print("\n🎬 NEW UNIQUE TICKET:")
     print("-"*40)
-    unique_ticket = "I need a new external monitor for my workstation. My current single monitor setup is limiting my productivity when working with multiple spreadsheets and client data. My manager has approved the hardware purchase."
+    unique_ticket = UNIQUE_TICKET
     
     print(f"💬 User Request: \"{unique_ticket}\"")
     print("⏰ Time: 2:30 PM")
     
-    start = time.time()
-    result = agent.create_ticket(unique_ticket, "maria.garcia@company.com")
-    processing_time = time.time() - start
+    if unique_run is None:
+        start = time.perf_counter()
+        result = cached_create_ticket(agent, unique_ticket, "maria.garcia@company.com")
+        processing_time = time.perf_counter() - start
+    else:
+        result, processing_time = unique_run
     
     print(f"\n📊 Result:")
     print(f"   Success: {result.get('success')}")
@@ -136,11 +165,14 @@ def main():
     print("⚡ Performance: Fast-loading architecture")
     
     try:
+        # One agent for every scenario, so the ADK/model setup runs once
+        agent = FastGoogleADKTicketCreationAgent()
+        
         # Test duplicate detection
-        result1, result2 = demonstrate_duplicate_detection()
+        result1, result2, unique_run = demonstrate_duplicate_detection(agent)
         
         # Test non-duplicate flow
-        result3 = demonstrate_non_duplicate_flow()
+        result3 = demonstrate_non_duplicate_flow(agent, unique_run)
         
         # Summary
         print("\n\n📊 DEMONSTRATION SUMMARY")
@@ -166,8 +198,7 @@ def main():
         
     except Exception as e:
         print(f"\n❌ Demonstration failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Duplicate detection demonstration failed")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -10,6 +10,9 @@ import time
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from agents.fast_ticket_creation_agent import FastGoogleADKTicketCreationAgent
+from config.logging_config import get_logger
+
+logger = get_logger("fast_agent_test")
 
 def test_fast_agent():
     """Test the fast-loading agent"""
@@ -18,19 +21,19 @@ def test_fast_agent():
     
     try:
         # Test import and creation speed
-        start_time = time.time()
+        start_time = time.perf_counter()
         print("📝 Creating fast agent...")
         agent = FastGoogleADKTicketCreationAgent()
-        creation_time = time.time() - start_time
+        creation_time = time.perf_counter() - start_time
         print(f"⚡ Agent created in {creation_time:.3f} seconds")
         
         # Test ticket creation (this will load dependencies)
         print("\n🎯 Testing ticket creation...")
         test_request = "My laptop screen keeps flickering and going black randomly, making it impossible to work on important presentations"
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = agent.create_ticket(test_request, "john.doe@company.com")
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         
         print(f"⏱️  Processing took {processing_time:.2f} seconds")
         print("\n📋 Results:")
@@ -45,8 +48,7 @@ def test_fast_agent():
         
     except Exception as e:
         print(f"❌ Error during testing: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Fast agent test failed")
         return False
 
 if __name__ == "__main__":
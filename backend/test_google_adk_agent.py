@@ -9,6 +9,9 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from agents.ticket_creation_agent import GoogleADKTicketCreationAgent
+from config.logging_config import get_logger
+
+logger = get_logger("google_adk_agent_test")
 
 
 def test_google_adk_agent():
@@ -53,8 +56,7 @@ def test_google_adk_agent():
         
     except Exception as e:
         print(f"❌ Error during testing: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Google ADK agent test failed")
         return False
 
 
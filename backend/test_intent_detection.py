@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+OCI Intent Detection Test
+Checks that batched OCI intent detection never leaves callers waiting forever
+"""
+
+import sys
+import os
+import asyncio
+import gc
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.intent_detection import IntentDetectionService
+from services.intent_result import IntentResult
+from services.keyword_intent import is_keyword_result
+
+_OCI_RESULT = IntentResult('Change', 0.95, 'OCI classification')
+
+
+def _service(classify):
+    """Service with OCI enabled and ``classify`` standing in for the OCI calls"""
+    service = IntentDetectionService()
+    service.use_oci = True
+    service._detect_intent_single = classify
+    service.detect_intents_batch = lambda items: [classify(message, history) for message, history in items]
+    return service
+
+
+def test_slow_classification_times_out_to_fallback():
+    """A caller gets the keyword result once the timeout expires"""
+    service = _service(lambda message, history: time.sleep(2))
+    service.detection_timeout = 0.1
+    started = time.monotonic()
+    result = service.detect_intent("My laptop is broken")
+    assert time.monotonic() - started < 1
+    assert is_keyword_result(result) and result.intent == "Incident"
+    service.close()
+
+
+def test_close_answers_queued_callers():
+    """Requests still waiting for a batch are answered when the service closes"""
+    service = _service(lambda message, history: time.sleep(2))
+    service.batch_wait_ms = 5000
+    results = []
+    caller = threading.Thread(target=lambda: results.append(service.detect_intent("I need access")))
+    caller.start()
+    time.sleep(0.1)
+    service.close()
+    caller.join(2)
+    assert not caller.is_alive()
+    assert is_keyword_result(results[0]) and results[0].intent == "Request"
+
+    # Once closed, callers are answered without queueing
+    assert is_keyword_result(service.detect_intent("I need access"))
+
+
+def test_async_detection_waits_for_oci_by_default():
+    """Without a speculative budget, async callers get OCI's answer"""
+    service = _service(lambda message, history: time.sleep(0.2) or _OCI_RESULT)
+    assert service.speculative_budget_ms == 0
+
+    async def run():
+        return await service.detect_intents_many(["My laptop is broken", "I need access"])
+
+    assert asyncio.run(run()) == [_OCI_RESULT, _OCI_RESULT]
+    service.close()
+
+
+def test_late_speculative_failure_is_retrieved():
+    """A failing OCI call that lost the race is logged, not left unretrieved"""
+    def fail(message, history):
+        time.sleep(0.2)
+        raise RuntimeError("OCI unavailable")
+
+    service = _service(fail)
+    service.speculative_budget_ms = 50
+    unhandled = []
+
+    async def run():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+        result = await service.async_detect_intent("My laptop is broken")
+        await asyncio.sleep(0.5)
+        gc.collect()
+        return result
+
+    result = asyncio.run(run())
+    assert is_keyword_result(result) and result.intent == "Incident"
+    assert not unhandled, unhandled
+    service.close()
+
+
+if __name__ == "__main__":
+    test_slow_classification_times_out_to_fallback()
+    test_close_answers_queued_callers()
+    test_async_detection_waits_for_oci_by_default()
+    test_late_speculative_failure_is_retrieved()
+    print("✅ OCI intent detection tests passed")
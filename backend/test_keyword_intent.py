@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Keyword Intent Test
+Checks that the regex and Aho-Corasick keyword classifiers agree with the
+original rule: the first category with any keyword in the message wins
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services import keyword_intent
+from services.keyword_intent import detect_keyword_intent, _KEYWORD_INTENTS
+
+MESSAGES = [
+    "My laptop is broken",
+    "The VPN is NOT WORKING since this morning",
+    "I need to change my password",
+    "Please upgrade the server, it keeps crashing",
+    "Check the status of my access request",
+    "Can you check for an update on INC0012345?",
+    "Where is the migration guide?",
+    "Change the schedule so the job does not hang",
+    "How do I update my account details?",
+    "Deploy the new build",
+    "What is the progress of my ticket",
+    "thanks!",
+    "",
+]
+
+
+def _reference_intent(message):
+    """The original substring scan over categories in priority order"""
+    lowered = message.lower()
+    for intent, confidence, keywords in _KEYWORD_INTENTS:
+        if any(keyword in lowered for keyword in keywords):
+            return intent, confidence
+    return 'Other', 0.3
+
+
+def _classify_all(automaton):
+    """Classify every message with the given automaton (None: regex path)"""
+    saved = keyword_intent._KEYWORD_AUTOMATON
+    keyword_intent._KEYWORD_AUTOMATON = automaton
+    try:
+        return [detect_keyword_intent(message) for message in MESSAGES]
+    finally:
+        keyword_intent._KEYWORD_AUTOMATON = saved
+
+
+def _assert_matches_reference(results):
+    for message, result in zip(MESSAGES, results):
+        assert (result.intent, result.confidence) == _reference_intent(message), message
+
+
+def test_regex_path_matches_reference():
+    """The precompiled regex reproduces the substring scan"""
+    _assert_matches_reference(_classify_all(None))
+
+
+def test_automaton_path_matches_reference():
+    """The Aho-Corasick automaton reproduces the substring scan"""
+    if keyword_intent.ahocorasick is None:
+        print("⚠️ pyahocorasick not installed, skipping automaton path")
+        return
+    _assert_matches_reference(_classify_all(keyword_intent._build_automaton()))
+
+
+def test_higher_priority_category_wins():
+    """Keywords from several categories resolve to the earliest category"""
+    cases = {
+        "Check the status of my access request": "Request",
+        "Can you check for an update on INC0012345?": "Change",
+        "How do I update my account details?": "Request",
+        "Change the schedule so the job does not hang": "Incident",
+    }
+    automata = [None]
+    if keyword_intent.ahocorasick is not None:
+        automata.append(keyword_intent._build_automaton())
+    for automaton in automata:
+        for message, result in zip(MESSAGES, _classify_all(automaton)):
+            if message in cases:
+                assert result.intent == cases[message], message
+
+
+if __name__ == "__main__":
+    test_regex_path_matches_reference()
+    test_automaton_path_matches_reference()
+    test_higher_priority_category_wins()
+    print("✅ Keyword intent tests passed")
@@ -43,12 +43,12 @@ class TicketCreationScenarios:
         print(f"⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("\n🚀 Processing request...")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Create ticket using the fast agent
             result = self.agent.create_ticket(user_request, user_email)
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             print(f"\n⏱️  Processing completed in {processing_time:.2f} seconds")
             print("\n📊 RESULTS:")
@@ -94,9 +94,7 @@ class TicketCreationScenarios:
             "Initial WiFi Issue"
         )
         
-        # Wait a bit to simulate time passage
         print("\n⏳ [30 minutes later...]")
-        time.sleep(2)
         
         # Second similar ticket request
         print("\n🎬 PART 2: Same user tries to create similar ticket")
@@ -278,7 +276,7 @@ class TicketCreationScenarios:
         print(f"🤖 Agent: Fast Google ADK Ticket Creation Agent")
         print(f"🎯 Framework: Google ADK with Gemini 2.5 Flash")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Run scenarios
         scenarios = [
@@ -296,13 +294,12 @@ class TicketCreationScenarios:
                 result = scenario()
                 results.append(result)
                 print("\n⏭️  Moving to next scenario...\n")
-                time.sleep(1)  # Brief pause between scenarios
             except Exception as e:
                 print(f"\n💥 Scenario failed: {e}")
                 results.append({"success": False, "error": str(e)})
         
         # Summary
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         
         print("\n" + "="*80)
         print("📊 TEST SUITE SUMMARY")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON Extraction Test
+Checks that JSONObjectStream finds the first JSON object in streamed LLM output
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.stream_json import JSONObjectStream
+
+
+def _stream(*chunks):
+    """Feed chunks until an object completes; return the stream"""
+    stream = JSONObjectStream()
+    for chunk in chunks:
+        if stream.feed(chunk):
+            break
+    return stream
+
+
+def test_prose_around_object():
+    """Text before and after the object is ignored"""
+    stream = _stream('Sure! Here is the result: {"intent": "Incident", "confidence": 0.9} Hope this helps.')
+    assert stream.value == {"intent": "Incident", "confidence": 0.9}
+
+
+def test_braces_inside_strings():
+    """Braces inside string values do not change the nesting depth"""
+    stream = _stream('{"rationale": "user typed } and { in the message", "intent": "Other"}')
+    assert stream.value == {"rationale": "user typed } and { in the message", "intent": "Other"}
+
+
+def test_escaped_quotes():
+    """Escaped quotes do not end a string"""
+    stream = _stream('{"rationale": "said \\"it is down}\\" twice", "intent": "Incident"}')
+    assert stream.value == {"rationale": 'said "it is down}" twice', "intent": "Incident"}
+
+
+def test_object_split_across_chunks():
+    """An object is assembled from chunks split mid-string, mid-escape and mid-nesting"""
+    chunks = ['Result: {"int', 'ent": "Req', 'uest", "meta": {"note": "a \\', '"b\\" {c}"', '}, "confidence": 0.', '8}', ' done']
+    stream = JSONObjectStream()
+    completed = [stream.feed(chunk) for chunk in chunks]
+    assert completed == [False] * 5 + [True, True]
+    assert stream.value == {"intent": "Request", "meta": {"note": 'a "b" {c}'}, "confidence": 0.8}
+
+
+def test_invalid_object_then_valid_object():
+    """A brace-delimited span that is not JSON is skipped"""
+    stream = _stream('Thinking {not json here} then ', '{"intent": "Status"}')
+    assert stream.value == {"intent": "Status"}
+
+
+def test_incomplete_object():
+    """No value is reported until the closing brace arrives"""
+    stream = JSONObjectStream()
+    assert not stream.feed('{"intent": "Change"')
+    assert stream.value is None
+
+
+if __name__ == "__main__":
+    test_prose_around_object()
+    test_braces_inside_strings()
+    test_escaped_quotes()
+    test_object_split_across_chunks()
+    test_invalid_object_then_valid_object()
+    test_incomplete_object()
+    print("✅ Streaming JSON extraction tests passed")
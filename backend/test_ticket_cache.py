@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Ticket Cache Test
+Checks that ticket reads racing an update never cache the pre-update record
+"""
+
+import sys
+import os
+import json
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.ticket_cache import TicketRecordCache
+from services.ticket_creation_service import ServiceNowTicketService
+
+
+class _Response:
+    def __init__(self, record):
+        self.status_code = 200
+        self.text = json.dumps({"result": record})
+        self.content = self.text.encode()
+
+
+class _SlowSession:
+    """Session whose GET returns the old record, with an update landing mid-read"""
+
+    def __init__(self):
+        self.reads = 0
+        self.started = threading.Event()
+        self.updated = threading.Event()
+
+    def get(self, url, **kwargs):
+        self.reads += 1
+        self.started.set()
+        self.updated.wait(5)
+        return _Response({"sys_id": "abc", "state": "1"})
+
+    def close(self):
+        pass
+
+
+def test_put_after_invalidate_is_discarded():
+    """A read started before an invalidation does not store its record"""
+    cache = TicketRecordCache()
+    version = cache.version("incident", "abc")
+    cache.invalidate("incident", "abc")
+    cache.put("incident", "abc", {"state": "1"}, version)
+    assert cache.get("incident", "abc") is None
+
+    version = cache.version("incident", "abc")
+    cache.put("incident", "abc", {"state": "2"}, version)
+    assert cache.get("incident", "abc") == {"state": "2"}
+
+
+def test_evicted_version_never_matches_older_read():
+    """Versions dropped from the bounded map still reject earlier reads"""
+    cache = TicketRecordCache(maxsize=1)
+    cache.invalidate("incident", "abc")
+    version = cache.version("incident", "abc")
+    cache.invalidate("incident", "other")  # evicts abc's version
+    cache.put("incident", "abc", {"state": "1"}, version)
+    assert cache.get("incident", "abc") is None
+
+
+def test_background_refresh_racing_update():
+    """A refresh in flight when the ticket is updated leaves the cache empty"""
+    service = ServiceNowTicketService()
+    service.ticket_cache = TicketRecordCache(ttl_seconds=10)
+    service.refresh_ahead_seconds = 10
+    service.ticket_cache.put("incident", "abc", {"sys_id": "abc", "state": "1"})
+    session = service.session = _SlowSession()
+
+    # Every cached entry is due for refresh, so this starts a background read
+    assert service.get_ticket_details("abc", "incident")["state"] == "1"
+    assert session.started.wait(5)
+
+    # The update invalidates the ticket while the refresh is still reading
+    service.invalidate_ticket("incident", "abc")
+    session.updated.set()
+    service._refresh_executor.shutdown(wait=True)
+
+    assert session.reads == 1
+    assert service.ticket_cache.get("incident", "abc") is None
+
+
+if __name__ == "__main__":
+    test_put_after_invalidate_is_discarded()
+    test_evicted_version_never_matches_older_read()
+    test_background_refresh_racing_update()
+    print("✅ Ticket cache tests passed")
@@ -16,7 +16,7 @@ class ServiceNowClient:
     """ServiceNow API client for searching historical tickets"""
     
     def __init__(self):
-        self.instance_url = os.getenv("SERVICENOW_INSTANCE_URL", "").replace("/login.do?user_name=admin&sys_action=sysverb_login&user_password=Bb7Q8Iqp%2Fp-B", "")
+        self.instance_url = os.getenv("SERVICENOW_INSTANCE_URL", "").split("/login.do", 1)[0].rstrip("/")
         self.username = os.getenv("SERVICENOW_USERNAME", "")
         self.password = os.getenv("SERVICENOW_PASSWORD", "")
         self.api_version = os.getenv("SERVICENOW_API_VERSION", "v2")
@@ -16,10 +16,7 @@ class ServiceNowClient:
     
     def __init__(self):
         instance_url = os.getenv("SERVICENOW_INSTANCE_URL", "")
-        self.instance_url = instance_url.replace(
-            "/login.do?user_name=admin&sys_action=sysverb_login&user_password=Bb7Q8Iqp%2Fp-B", 
-            ""
-        )
+        self.instance_url = instance_url.split("/login.do", 1)[0].rstrip("/")
         self.username = os.getenv("SERVICENOW_USERNAME", "")
         self.password = os.getenv("SERVICENOW_PASSWORD", "")
         self.timeout = int(os.getenv("SERVICENOW_TIMEOUT", "30"))